@@ -54,13 +54,15 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
 
 from .const import (
+    CONF_DEVICE_ID,
+    CONF_DEVICE_IEEE,
     DOMAIN,
-    EVENT_UBISYS_CALIBRATION_COMPLETE,
-    EVENT_UBISYS_INPUT,
+    get_device_type,
 )
 from .discovery import async_setup_discovery
 from .entity_management import (
     async_cleanup_orphaned_entities,
+    async_cleanup_orphaned_entities_batch,
     async_cleanup_orphaned_ubisys_device,
     async_ensure_device_entry,
     async_ensure_zha_entity_enabled,
@@ -68,7 +70,7 @@ from .entity_management import (
     async_unhide_zha_entity,
     async_untrack_zha_entities,
     options_update_listener,
-    recompute_verbose_flags,
+    update_verbose_flags,
 )
 from .input_monitor import (
     async_setup_input_monitoring,
@@ -79,19 +81,43 @@ from .services import async_setup_services
 if TYPE_CHECKING:
     from homeassistant.helpers.typing import ConfigType
 
+# Entry points Home Assistant looks up on the integration module
+__all__ = (
+    "CONFIG_SCHEMA",
+    "async_migrate_entry",
+    "async_setup",
+    "async_setup_entry",
+    "async_unload_entry",
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 # Platforms to set up for this integration
 # Cover: J1 window covering controllers
 # Light: D1 universal dimmers
 # Button: Calibration button for J1 devices
-PLATFORMS: list[Platform] = [
+PLATFORMS: tuple[Platform, ...] = (
     Platform.COVER,
     Platform.LIGHT,
     Platform.SWITCH,
     Platform.SENSOR,
     Platform.BUTTON,
-]
+)
+
+# Platforms that actually create entities for each device type; every device
+# gets the last-input sensor. Unknown types fall back to all PLATFORMS.
+_PLATFORMS_BY_TYPE: dict[str, tuple[Platform, ...]] = {
+    "window_covering": (Platform.COVER, Platform.BUTTON, Platform.SENSOR),
+    "dimmer": (Platform.LIGHT, Platform.SENSOR),
+    "switch": (Platform.SWITCH, Platform.SENSOR),
+}
+
+
+def _platforms_for_entry(entry: ConfigEntry) -> tuple[Platform, ...]:
+    """Return the platforms to forward a config entry to."""
+    return _PLATFORMS_BY_TYPE.get(
+        get_device_type(entry.data.get("model", "")), PLATFORMS
+    )
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -100,6 +126,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     This function is called once when the integration is loaded. It:
     1. Registers all device-specific services
     2. Sets up device discovery listener
+    3. Cleans up orphaned entities for all configured devices
     """
     # Initialize integration data storage
     hass.data.setdefault(DOMAIN, {})
@@ -110,33 +137,21 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     # Set up discovery and listeners
     async_setup_discovery(hass)
 
-    # Register logbook event descriptions
-    try:
-        from homeassistant.components import logbook
-
-        logbook.async_describe_event(
-            hass,
-            DOMAIN,
-            EVENT_UBISYS_CALIBRATION_COMPLETE,
-            lambda event: (
-                f"Ubisys calibration completed "
-                f"({event.data.get('shade_type', 'unknown')}) "
-                f"in {event.data.get('duration_s', '?')}s"
-            ),
-        )
-        logbook.async_describe_event(
-            hass,
-            DOMAIN,
-            EVENT_UBISYS_INPUT,
-            lambda event: (
-                f"Ubisys input {event.data.get('press_type', 'unknown')} "
-                f"on input {event.data.get('input_number', '?')}"
-            ),
+    # BUGFIX: Clean up orphaned entities from previous configurations. Done once
+    # for all configured devices here rather than per entry, so the entity
+    # registry is walked a single time at startup.
+    device_ieees = {
+        device_ieee
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if (device_ieee := entry.data.get(CONF_DEVICE_IEEE))
+    }
+    orphaned_count = await async_cleanup_orphaned_entities_batch(hass, device_ieees)
+    if orphaned_count > 0:
+        _LOGGER.info(
+            "Cleaned up %d orphaned entities for %d devices",
+            orphaned_count,
+            len(device_ieees),
         )
-        _LOGGER.debug("Registered logbook event descriptions")
-    except Exception as err:
-        # Logbook integration might not be available - this is non-critical
-        _LOGGER.debug("Could not register logbook descriptions: %s", err)
 
     return True
 
@@ -145,45 +160,59 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Ubisys device from a config entry."""
     _LOGGER.debug("Setting up Ubisys config entry: %s", entry.entry_id)
 
-    # Store entry data in integration storage
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
+    # Store entry data in integration storage (initialized by async_setup,
+    # which Home Assistant always runs before any entry is set up)
+    domain_data = hass.data[DOMAIN]
+    domain_data[entry.entry_id] = entry.data
 
-    device_ieee = entry.data["device_ieee"]
-
-    # BUGFIX: Clean up orphaned entities from previous configurations
-    orphaned_count = await async_cleanup_orphaned_entities(hass, device_ieee)
-    if orphaned_count > 0:
-        _LOGGER.info(
-            "Cleaned up %d orphaned entities for device %s",
-            orphaned_count,
-            device_ieee,
-        )
+    # Index the entry by IEEE so discovery can skip configured devices in O(1)
+    domain_data.setdefault("entries_by_ieee", {})[entry.data[CONF_DEVICE_IEEE]] = entry
 
     # BUGFIX: Explicitly create/restore device entry
     await async_ensure_device_entry(hass, entry)
 
-    # Set up platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-
-    # Hide the original ZHA entity to prevent duplicates
-    await async_hide_zha_entity(hass, entry)
+    # Index the entry by HA device id so registry listeners can resolve it
+    # without scanning every config entry
+    if device_id := entry.data.get(CONF_DEVICE_ID):
+        domain_data.setdefault("entries_by_device_id", {})[device_id] = entry
 
-    # Ensure ZHA entity stays enabled (but hidden) for wrapper delegation
-    await async_ensure_zha_entity_enabled(hass, entry)
+    # Hide the original ZHA entity to prevent duplicates. Neither this nor input
+    # monitoring depends on our platforms, so start both before forwarding the
+    # platforms and let them run concurrently with platform setup.
+    entry.async_create_background_task(
+        hass, _async_hide_zha_entity_for_wrapper(hass, entry), "ubisys_hide_zha"
+    )
 
     # Set up input monitoring (idempotent)
-    hass.async_create_task(async_setup_input_monitoring(hass, entry.entry_id))
+    hass.async_create_task(
+        async_setup_input_monitoring(hass, entry.entry_id),
+        name="ubisys_input_monitor_setup",
+    )
+
+    # Set up platforms
+    await hass.config_entries.async_forward_entry_setups(
+        entry, _platforms_for_entry(entry)
+    )
 
     # Track options updates to refresh verbose flags
     entry.async_on_unload(entry.add_update_listener(options_update_listener))
 
-    # Recompute verbose flags across entries
-    recompute_verbose_flags(hass)
+    # Account for this entry's verbose options in the global flags
+    update_verbose_flags(hass, entry)
 
     return True
 
 
+async def _async_hide_zha_entity_for_wrapper(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> None:
+    """Hide the original ZHA entity while keeping it enabled for delegation."""
+    await async_hide_zha_entity(hass, entry)
+
+    # Ensure ZHA entity stays enabled (but hidden) for wrapper delegation
+    await async_ensure_zha_entity_enabled(hass, entry)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Unloading Ubisys config entry: %s", entry.entry_id)
@@ -198,25 +227,45 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await async_unload_input_monitoring(hass)
 
     # Unload platforms
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, _platforms_for_entry(entry)
+    )
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
-        recompute_verbose_flags(hass)
+        domain_data = hass.data[DOMAIN]
+        domain_data.pop(entry.entry_id)
+        domain_data.get("entries_by_device_id", {}).pop(
+            entry.data.get(CONF_DEVICE_ID), None
+        )
+        domain_data.get("entries_by_ieee", {}).pop(
+            entry.data.get(CONF_DEVICE_IEEE), None
+        )
+        update_verbose_flags(hass, entry, unloading=True)
 
-        # Clean up any remaining orphaned entities for this device
+        # Clean up any remaining orphaned entities for this device. Nothing
+        # depends on the result, so don't hold up the unload for it.
         device_ieee = entry.data.get("device_ieee")
         if device_ieee:
-            orphaned_count = await async_cleanup_orphaned_entities(hass, device_ieee)
-            if orphaned_count > 0:
-                _LOGGER.debug(
-                    "Cleaned up %d orphaned entities during unload",
-                    orphaned_count,
-                )
+            hass.async_create_background_task(
+                _async_cleanup_orphans_after_unload(hass, device_ieee),
+                f"ubisys_cleanup_{device_ieee}",
+            )
 
     return bool(unload_ok)
 
 
+async def _async_cleanup_orphans_after_unload(
+    hass: HomeAssistant, device_ieee: str
+) -> None:
+    """Remove orphaned entities left behind by an unloaded entry."""
+    orphaned_count = await async_cleanup_orphaned_entities(hass, device_ieee)
+    if orphaned_count > 0:
+        _LOGGER.debug(
+            "Cleaned up %d orphaned entities during unload",
+            orphaned_count,
+        )
+
+
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Migrate old entry."""
     _LOGGER.debug("Migrating Ubisys entry from version %s", entry.version)
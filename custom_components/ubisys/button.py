@@ -58,14 +58,22 @@ C. Both button and service (current approach):
 from __future__ import annotations
 
 import logging
+from typing import Any, cast
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_DEVICE_IEEE, DOMAIN, SERVICE_CALIBRATE_COVER
-from .helpers import is_verbose_info_logging
+from .const import (
+    CONF_DEVICE_IEEE,
+    DOMAIN,
+    SERVICE_CALIBRATE_COVER,
+    WINDOW_COVERING_MODELS,
+)
+from .helpers import verbose_info_log_level
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -88,8 +96,6 @@ async def async_setup_entry(
     # D1 devices are dimmers (no motor, no calibration needed)
     # S1 devices are switches (no motor, no calibration needed)
     # Both D1/S1 have input configuration via services, but not calibration
-    from .const import WINDOW_COVERING_MODELS
-
     if model not in WINDOW_COVERING_MODELS:
         _LOGGER.debug(
             "Skipping calibration buttons for non-window-covering device: model=%s (ieee=%s)",
@@ -99,7 +105,7 @@ async def async_setup_entry(
         return
 
     _LOGGER.log(
-        logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+        verbose_info_log_level(hass),
         "Creating Ubisys calibration buttons for J1 device: %s",
         device_ieee,
     )
@@ -119,11 +125,17 @@ async def async_setup_entry(
 
 
 class UbisysCalibrationButton(ButtonEntity):
-    """Button entity to trigger calibration."""
+    """Button entity to trigger calibration.
+
+    Subclasses only override the presentation attributes and ``_test_mode``;
+    cover lookup and the service call are shared.
+    """
 
     _attr_has_entity_name = True
     _attr_name = "Calibrate"
     _attr_icon = "mdi:tune"
+    _unique_id_suffix = "calibrate"
+    _test_mode = False
 
     def __init__(
         self,
@@ -131,56 +143,51 @@ class UbisysCalibrationButton(ButtonEntity):
         config_entry: ConfigEntry,
         device_ieee: str,
     ) -> None:
-        """Initialize the calibration button."""
+        """Initialize the button."""
         self.hass = hass
         self._config_entry = config_entry
         self._device_ieee = device_ieee
 
         # Set unique ID
-        self._attr_unique_id = f"{device_ieee}_calibrate"
+        self._attr_unique_id = f"{device_ieee}_{self._unique_id_suffix}"
 
         # Set device info to link to the same device as the cover
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_ieee)},
-        }
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, device_ieee)})
 
-        _LOGGER.debug("Initialized UbisysCalibrationButton: ieee=%s", device_ieee)
+        _LOGGER.debug("Initialized %s: ieee=%s", type(self).__name__, device_ieee)
 
     async def async_press(self) -> None:
-        """Handle the calibration button press.
+        """Handle the button press.
 
         Delegates to the ubisys.calibrate_j1 service for the device's cover entity.
         """
-        from homeassistant.helpers import entity_registry as er
-
         _LOGGER.log(
-            logging.INFO if is_verbose_info_logging(self.hass) else logging.DEBUG,
-            "Calibration button pressed for device: %s",
+            verbose_info_log_level(self.hass),
+            "%s button pressed for device: %s",
+            self._attr_name,
             self._device_ieee,
         )
 
-        entity_registry = er.async_get(self.hass)
-        entries = er.async_entries_for_config_entry(
-            entity_registry, self._config_entry.entry_id
-        )
-        cover_entity_id = next(
-            (e.entity_id for e in entries if e.domain == "cover"), None
-        )
+        cover_entity_id = _async_find_cover_entity_id(self.hass, self._device_ieee)
         if not cover_entity_id:
             _LOGGER.error(
                 "Could not find cover entity for device: %s", self._device_ieee
             )
             return
 
+        service_data: dict[str, Any] = {"entity_id": cover_entity_id}
+        if self._test_mode:
+            service_data["test_mode"] = True
+
         try:
             await self.hass.services.async_call(
                 DOMAIN,
                 SERVICE_CALIBRATE_COVER,
-                {"entity_id": cover_entity_id},
+                service_data,
                 blocking=False,
             )
             _LOGGER.log(
-                logging.INFO if is_verbose_info_logging(self.hass) else logging.DEBUG,
+                verbose_info_log_level(self.hass),
                 "Calibration service called for: %s",
                 cover_entity_id,
             )
@@ -188,41 +195,22 @@ class UbisysCalibrationButton(ButtonEntity):
             _LOGGER.error("Failed to call calibration service: %s", err)
 
 
-class UbisysHealthCheckButton(ButtonEntity):
+class UbisysHealthCheckButton(UbisysCalibrationButton):
     """Button entity to run a read-only J1 health check (test_mode)."""
 
-    _attr_has_entity_name = True
     _attr_name = "Health Check"
     _attr_icon = "mdi:heart-pulse"
+    _unique_id_suffix = "health_check"
+    _test_mode = True
 
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        config_entry: ConfigEntry,
-        device_ieee: str,
-    ) -> None:
-        self.hass = hass
-        self._config_entry = config_entry
-        self._device_ieee = device_ieee
-        self._attr_unique_id = f"{device_ieee}_health_check"
-        self._attr_device_info = {"identifiers": {(DOMAIN, device_ieee)}}
 
-    async def async_press(self) -> None:
-        """Run a read-only health check (test_mode)."""
-        from homeassistant.helpers import entity_registry as er
+def _async_find_cover_entity_id(hass: HomeAssistant, device_ieee: str) -> str | None:
+    """Return the Ubisys cover entity for a device via the unique_id index.
 
-        entity_registry = er.async_get(self.hass)
-        entries = er.async_entries_for_config_entry(
-            entity_registry, self._config_entry.entry_id
-        )
-        cover_entity_id = next(
-            (e.entity_id for e in entries if e.domain == "cover"), None
-        )
-        if not cover_entity_id:
-            return
-        await self.hass.services.async_call(
-            DOMAIN,
-            SERVICE_CALIBRATE_COVER,
-            {"entity_id": cover_entity_id, "test_mode": True},
-            blocking=False,
-        )
+    The cover's unique_id is derived from the IEEE address, so this is a
+    direct registry index lookup instead of a scan of the entry's entities.
+    """
+    return cast(
+        str | None,
+        er.async_get(hass).async_get_entity_id("cover", DOMAIN, f"{device_ieee}_cover"),
+    )
@@ -58,12 +58,16 @@ from .const import (
     PHASE_MODES,
     SERVICE_TUNE_J1_ADVANCED,
     SHADE_TYPES,
+    SUPPORTED_MODELS,
+    UBISYS_MANUFACTURERS,
     get_device_type,
+    normalize_model,
 )
 from .d1_config import (
     async_configure_ballast,
     async_configure_phase_mode,
 )
+from .helpers import extract_ieee_from_device, verbose_info_log_level
 from .input_config import (
     InputActionBuilder,
     InputConfigPreset,
@@ -213,10 +217,8 @@ class UbisysConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
             if not zha_config_entry_id:
                 return self.async_abort(reason="zha_not_found")
 
-            from .helpers import is_verbose_info_logging
-
             _LOGGER.log(
-                logging.INFO if is_verbose_info_logging(self.hass) else logging.DEBUG,
+                verbose_info_log_level(self.hass),
                 "Creating config entry for D1 dimmer: %s",
                 self._discovery_data["name"],
             )
@@ -239,10 +241,8 @@ class UbisysConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
             if not zha_config_entry_id:
                 return self.async_abort(reason="zha_not_found")
 
-            from .helpers import is_verbose_info_logging
-
             _LOGGER.log(
-                logging.INFO if is_verbose_info_logging(self.hass) else logging.DEBUG,
+                verbose_info_log_level(self.hass),
                 "Creating config entry for S1/S1-R switch: %s",
                 self._discovery_data["name"],
             )
@@ -337,34 +337,25 @@ class UbisysConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignor
 
         Returns a dict mapping device IEEE to device info.
         """
-        from .const import MANUFACTURER, SUPPORTED_MODELS
-
         device_registry = dr.async_get(self.hass)
         available: dict[str, dict[str, Any]] = {}
 
         # Find all Ubisys devices
         for device_entry in device_registry.devices.values():
             # Check manufacturer and model
-            if device_entry.manufacturer != MANUFACTURER:
+            if device_entry.manufacturer not in UBISYS_MANUFACTURERS:
                 continue
 
             # Extract model (remove any parenthetical suffixes like "(5502)")
             # ZHA may report "J1 (5502)" but we want just "J1"
-            model = device_entry.model
-            if model and "(" in model:
-                model = model.split("(")[0].strip()
+            model = normalize_model(device_entry.model)
 
             if model not in SUPPORTED_MODELS:
                 continue
 
             # Extract IEEE from identifiers
-            device_ieee = None
-            for identifier_set in device_entry.identifiers:
-                if identifier_set[0] == "zha":
-                    device_ieee = identifier_set[1]
-                    break
-
-            if not device_ieee:
+            device_ieee = extract_ieee_from_device(device_entry)
+            if device_ieee is None:
                 continue
 
             # Check if already configured
@@ -464,12 +455,6 @@ class UbisysOptionsFlow(config_entries.OptionsFlow):
                 # Update config entry with new shade type
                 new_shade_type = user_input[CONF_SHADE_TYPE]
 
-                # Update entry data (requires updating the entry itself since data is immutable)
-                self.hass.config_entries.async_update_entry(
-                    self.config_entry,
-                    data={**self.config_entry.data, CONF_SHADE_TYPE: new_shade_type},
-                )
-
                 # Update logging options from form
                 new_options = {
                     **self.config_entry.options,
@@ -490,8 +475,12 @@ class UbisysOptionsFlow(config_entries.OptionsFlow):
                         )
                     ),
                 }
+                # One update for data and options: each update_entry call
+                # schedules the update listener, and a shade type change there
+                # reloads the entry
                 self.hass.config_entries.async_update_entry(
                     self.config_entry,
+                    data={**self.config_entry.data, CONF_SHADE_TYPE: new_shade_type},
                     options=new_options,
                 )
 
@@ -577,14 +566,8 @@ class UbisysOptionsFlow(config_entries.OptionsFlow):
                 # Convert string value to enum
                 preset = InputConfigPreset(preset_value)
 
-                from .helpers import is_verbose_info_logging
-
                 _LOGGER.log(
-                    (
-                        logging.INFO
-                        if is_verbose_info_logging(self.hass)
-                        else logging.DEBUG
-                    ),
+                    verbose_info_log_level(self.hass),
                     "Applying input preset '%s' to %s (%s)",
                     preset.value,
                     device_name,
@@ -619,11 +602,7 @@ class UbisysOptionsFlow(config_entries.OptionsFlow):
                 )
 
                 _LOGGER.log(
-                    (
-                        logging.INFO
-                        if is_verbose_info_logging(self.hass)
-                        else logging.DEBUG
-                    ),
+                    verbose_info_log_level(self.hass),
                     "✓ Successfully applied input preset '%s' to %s",
                     preset.value,
                     device_name,
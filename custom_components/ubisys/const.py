@@ -25,8 +25,15 @@ from homeassistant.components.cover import CoverEntityFeature
 
 DOMAIN: Final = "ubisys"
 MANUFACTURER: Final = "ubisys"
+# Manufacturer strings reported by Ubisys devices across firmware releases
+UBISYS_MANUFACTURERS: Final = frozenset(
+    {MANUFACTURER, "Ubisys", "ubisys Technologies", "ubisys technologies GmbH"}
+)
 UBISYS_MANUFACTURER_CODE: Final = 0x10F2
 
+# Window in which device-registry create events are coalesced into one rescan
+DISCOVERY_DEBOUNCE_DELAY: Final = 1.0  # seconds
+
 # Configuration and options (used in config entries)
 CONF_DEVICE_IEEE: Final = "device_ieee"
 CONF_DEVICE_ID: Final = "device_id"
@@ -46,16 +53,17 @@ CONF_INPUT_CONFIG_PRESET: Final = (
 # Separate device models by type for easy categorization
 
 # Window covering controllers (support calibration)
-WINDOW_COVERING_MODELS: Final = ["J1", "J1-R"]
+WINDOW_COVERING_MODELS: Final = frozenset({"J1", "J1-R"})
 
 # Universal dimmers (support phase control, ballast config)
-DIMMER_MODELS: Final = ["D1", "D1-R"]
+DIMMER_MODELS: Final = frozenset({"D1", "D1-R"})
 
 # Power switches
-SWITCH_MODELS: Final = ["S1", "S1-R"]  # S2/S2-R support planned for future
+SWITCH_MODELS: Final = frozenset({"S1", "S1-R"})  # S2/S2-R support planned
 
-# All supported models
-SUPPORTED_MODELS: Final = WINDOW_COVERING_MODELS + DIMMER_MODELS + SWITCH_MODELS
+# All supported models (frozensets: model checks run on every discovered
+# device and platform setup)
+SUPPORTED_MODELS: Final = WINDOW_COVERING_MODELS | DIMMER_MODELS | SWITCH_MODELS
 
 # Shade types
 SHADE_TYPE_ROLLER: Final = "roller"
@@ -160,10 +168,11 @@ UBISYS_ATTR_INSTALLED_OPEN_LIMIT_TILT: Final = 0x0012  # Open limit for tilt (0.
 UBISYS_ATTR_INSTALLED_CLOSED_LIMIT_TILT: Final = 0x0013  # Closed limit for tilt (0.1°)
 
 # Calibration timing constants (used by j1_calibration.py)
-STALL_DETECTION_INTERVAL: Final = 0.5  # Check position every 0.5 seconds
 STALL_DETECTION_TIME: Final = 3.0  # Position unchanged for 3s = stall
 PER_MOVE_TIMEOUT: Final = 120  # Maximum 120s per movement
 SETTLE_TIME: Final = 1.0  # Wait 1s after stopping
+# Backoff between total-steps reads until the device reports a valid count
+TOTAL_STEPS_READ_BACKOFF: Final = (0.25, 0.5, 1.0, 2.0)
 
 # Service parameters
 ATTR_ENTITY_ID: Final = "entity_id"
@@ -366,6 +375,25 @@ def get_device_type(model: str) -> str:
     return "unknown"
 
 
+def normalize_model(model: str | None) -> str:
+    """Strip a parenthetical suffix from a ZHA-reported model string.
+
+    ZHA may report "J1 (5502)" where we want just "J1". Canonical model
+    names are returned as is, without allocating new strings.
+
+    Args:
+        model: Model string as reported in the device registry
+
+    Returns:
+        Model code, or "" if none was reported
+    """
+    if not model:
+        return ""
+    if model in SUPPORTED_MODELS:
+        return model
+    return model.partition("(")[0].strip()
+
+
 def supports_calibration(model: str) -> bool:
     """Check if device model supports calibration.
 
@@ -18,6 +18,7 @@ from homeassistant.components.cover import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 
@@ -27,9 +28,10 @@ from .const import (
     CONF_SHADE_TYPE,
     DOMAIN,
     SHADE_TYPE_TO_FEATURES,
+    WINDOW_COVERING_MODELS,
 )
 from .ha_typing import callback as _typed_callback
-from .helpers import is_verbose_info_logging
+from .helpers import verbose_info_log_level
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,8 +53,6 @@ async def async_setup_entry(
 
     # Only create cover entities for J1/J1-R window covering models
     # D1 devices are lights, S1 devices are switches
-    from .const import WINDOW_COVERING_MODELS
-
     if model not in WINDOW_COVERING_MODELS:
         _LOGGER.debug(
             "Skipping cover entity for non-window-covering device: model=%s (ieee=%s)",
@@ -67,7 +67,7 @@ async def async_setup_entry(
     # Note: ZHA entity auto-enable is handled centrally in __init__.py
 
     _LOGGER.log(
-        logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+        verbose_info_log_level(hass),
         "Creating Ubisys cover wrapper for %s (ZHA entity: %s, shade type: %s)",
         device_ieee,
         zha_entity_id,
@@ -173,9 +173,7 @@ class UbisysCover(CoverEntity):
         self._attr_unique_id = f"{device_ieee}_cover"
 
         # Set device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_ieee)},
-        }
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, device_ieee)})
 
         # Set filtered features based on shade type
         self._attr_supported_features = SHADE_TYPE_TO_FEATURES.get(
@@ -194,6 +192,18 @@ class UbisysCover(CoverEntity):
         # where ZHA hasn't created its entity yet
         self._zha_entity_available = False
 
+        # State attributes never change for the entity's lifetime apart from
+        # the availability hint, so build both variants once
+        self._attrs_available: dict[str, Any] = {
+            "shade_type": shade_type,
+            "zha_entity_id": zha_entity_id,
+            "integration": "ubisys",
+        }
+        self._attrs_unavailable: dict[str, Any] = {
+            **self._attrs_available,
+            "unavailable_reason": "ZHA entity not found or unavailable",
+        }
+
         _LOGGER.debug(
             "Initialized UbisysCover: ieee=%s, zha_entity=%s, shade_type=%s, features=%s",
             device_ieee,
@@ -260,13 +270,12 @@ class UbisysCover(CoverEntity):
             self._zha_entity_available = True
 
         # Update state attributes from ZHA entity
+        attrs = zha_state.attributes
         self._attr_is_closed = zha_state.state == "closed"
-        self._attr_is_closing = zha_state.attributes.get("is_closing")
-        self._attr_is_opening = zha_state.attributes.get("is_opening")
-        self._attr_current_cover_position = zha_state.attributes.get("current_position")
-        self._attr_current_cover_tilt_position = zha_state.attributes.get(
-            "current_tilt_position"
-        )
+        self._attr_is_closing = attrs.get("is_closing")
+        self._attr_is_opening = attrs.get("is_opening")
+        self._attr_current_cover_position = attrs.get("current_position")
+        self._attr_current_cover_tilt_position = attrs.get("current_tilt_position")
 
         self.async_write_ha_state()
 
@@ -298,17 +307,10 @@ class UbisysCover(CoverEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return entity specific state attributes."""
-        attrs = {
-            "shade_type": self._shade_type,
-            "zha_entity_id": self._zha_entity_id,
-            "integration": "ubisys",
-        }
-
         # Add availability info for debugging
         if not self._zha_entity_available:
-            attrs["unavailable_reason"] = "ZHA entity not found or unavailable"
-
-        return attrs
+            return self._attrs_unavailable
+        return self._attrs_available
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
@@ -71,8 +71,8 @@ from .helpers import (
     async_write_and_verify_attrs,
     get_cluster,
     get_entity_device_info,
-    is_verbose_info_logging,
     validate_ubisys_entity,
+    verbose_info_log_level,
 )
 from .logtools import Stopwatch, info_banner, kv
 
@@ -219,7 +219,7 @@ async def async_configure_phase_mode(
                 await asyncio.sleep(0.5)
 
             _LOGGER.log(
-                logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+                verbose_info_log_level(hass),
                 "D1 Config: Configuring phase mode for %s: %s (%d)",
                 entity_id,
                 phase_mode,
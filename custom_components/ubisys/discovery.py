@@ -8,28 +8,39 @@ This module handles:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Coroutine
+from typing import Any, cast
 
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
-
-try:
-    from homeassistant.helpers.device_registry import (
-        async_track_device_registry_updated_event,
-    )
-except Exception:  # Older HA versions may not provide this helper
-    async_track_device_registry_updated_event = None
-
-from .const import DOMAIN, MANUFACTURER, SUPPORTED_MODELS
-from .entity_management import async_cleanup_orphaned_entities
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.start import async_at_started
+
+from .const import (
+    DISCOVERY_DEBOUNCE_DELAY,
+    DOMAIN,
+    SUPPORTED_MODELS,
+    UBISYS_MANUFACTURERS,
+    normalize_model,
+)
+from .entity_management import (
+    async_cleanup_orphaned_entities,
+    invalidate_zha_entity_cache,
+)
 from .ha_typing import HAEvent
-from .helpers import is_verbose_info_logging
+from .ha_typing import callback as _typed_callback
+from .helpers import extract_ieee_from_device, verbose_info_log_level
 from .input_monitor import async_setup_input_monitoring
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum number of devices whose input monitoring is set up at once
+_INPUT_MONITOR_SETUP_LIMIT = 4
+
 
 async def async_discover_devices(hass: HomeAssistant) -> None:
     """Scan device registry for Ubisys devices and trigger config flow.
@@ -40,6 +51,12 @@ async def async_discover_devices(hass: HomeAssistant) -> None:
     """
     _LOGGER.debug("Scanning device registry for Ubisys devices...")
 
+    # Resolve once; the level and both guards are reused for every device
+    # logged below so disabled messages never build their argument tuples
+    info_level = verbose_info_log_level(hass)
+    log_info = _LOGGER.isEnabledFor(info_level)
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
     # Get device registry
     device_registry = dr.async_get(hass)
 
@@ -48,81 +65,90 @@ async def async_discover_devices(hass: HomeAssistant) -> None:
     configured_count = 0
     triggered_count = 0
 
-    # Scan all devices in registry
-    for device_entry in device_registry.devices.values():
-        # Skip devices without identifiers
-        if not device_entry.identifiers:
-            continue
+    # Configured entries do not change while we scan; index them by IEEE once
+    configured_entries = {
+        entry.data.get("device_ieee"): entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+    }
+
+    # Unsupported Ubisys models never become supported while HA runs, so an
+    # earlier scan's verdict is final. Supported devices are rescanned: the
+    # configured-entries check and the flow's unique_id handling cover those,
+    # and a dismissed flow or a deleted entry can then be offered again.
+    seen_devices: set[str] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        "discovery_seen_devices", set()
+    )
 
-        # Check if this is a ZHA device
-        zha_identifier = None
-        for identifier_domain, identifier_value in device_entry.identifiers:
-            if identifier_domain == "zha":
-                zha_identifier = identifier_value
-                break
+    # Only devices belonging to a ZHA config entry can be Ubisys candidates
+    zha_entry_ids = {
+        zha_entry.entry_id for zha_entry in hass.config_entries.async_entries("zha")
+    }
 
-        if not zha_identifier:
-            continue
+    # Discovery flows to start once the scan is complete
+    flows: list[Coroutine[Any, Any, Any]] = []
+    flow_devices: list[str] = []
 
-        # Check if it's a Ubisys device
-        if device_entry.manufacturer != MANUFACTURER:
+    for device_entry in device_registry.devices.values():
+        if device_entry.id in seen_devices or not (
+            device_entry.config_entries & zha_entry_ids
+        ):
             continue
 
-        # Extract model (remove any parenthetical suffixes)
-        model = device_entry.model
-        if model and "(" in model:
-            model = model.split("(")[0].strip()
+        identity = _ubisys_zha_identity(device_entry)
+        if identity is None:
+            continue
+        ieee, model = identity
 
         # Check if it's a supported model
         if model not in SUPPORTED_MODELS:
-            _LOGGER.debug(
-                "Found unsupported Ubisys device: %s (supported: %s)",
-                model,
-                SUPPORTED_MODELS,
-            )
+            if debug:
+                _LOGGER.debug(
+                    "Found unsupported Ubisys device: %s (supported: %s)",
+                    model,
+                    sorted(SUPPORTED_MODELS),
+                )
+            seen_devices.add(device_entry.id)
             continue
 
         found_count += 1
-        _LOGGER.debug(
-            "Found Ubisys device: %s %s (IEEE: %s, ID: %s)",
-            device_entry.manufacturer,
-            model,
-            zha_identifier,
-            device_entry.id,
-        )
+        if debug:
+            _LOGGER.debug(
+                "Found Ubisys device: %s %s (IEEE: %s, ID: %s)",
+                device_entry.manufacturer,
+                model,
+                ieee,
+                device_entry.id,
+            )
 
         # Check if already configured
-        already_configured = False
-        for entry in hass.config_entries.async_entries(DOMAIN):
-            if entry.data.get("device_ieee") == str(zha_identifier):
-                configured_count += 1
-                already_configured = True
+        existing_entry = configured_entries.get(ieee)
+        if existing_entry is not None:
+            configured_count += 1
+            if debug:
                 _LOGGER.debug(
                     "Device %s already configured (entry: %s)",
-                    zha_identifier,
-                    entry.title,
+                    ieee,
+                    existing_entry.title,
                 )
-                break
-
-        if already_configured:
             continue
 
         # Trigger discovery config flow
         triggered_count += 1
-        _LOGGER.log(
-            logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
-            "Auto-discovering Ubisys device: %s %s (IEEE: %s)",
-            device_entry.manufacturer,
-            model,
-            zha_identifier,
-        )
-
-        hass.async_create_task(
+        if log_info:
+            _LOGGER.log(
+                info_level,
+                "Auto-discovering Ubisys device: %s %s (IEEE: %s)",
+                device_entry.manufacturer,
+                model,
+                ieee,
+            )
+        flow_devices.append(ieee)
+        flows.append(
             hass.config_entries.flow.async_init(
                 DOMAIN,
                 context={"source": "zha"},
                 data={
-                    "device_ieee": str(zha_identifier),
+                    "device_ieee": ieee,
                     "device_id": device_entry.id,
                     "manufacturer": device_entry.manufacturer,
                     "model": model,
@@ -131,8 +157,19 @@ async def async_discover_devices(hass: HomeAssistant) -> None:
             )
         )
 
+    # Start all discovery flows together rather than as one task each; a
+    # failing flow must not abort the others
+    results = await asyncio.gather(*flows, return_exceptions=True)
+    for ieee, result in zip(flow_devices, results):
+        if isinstance(result, Exception):
+            _LOGGER.warning(
+                "Failed to start discovery flow for Ubisys device %s: %s",
+                ieee,
+                result,
+            )
+
     _LOGGER.log(
-        logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+        info_level,
         "Device discovery complete: %d Ubisys devices found, "
         "%d already configured, %d new config flows triggered",
         found_count,
@@ -141,108 +178,237 @@ async def async_discover_devices(hass: HomeAssistant) -> None:
     )
 
 
+def _ubisys_zha_identity(device_entry: dr.DeviceEntry) -> tuple[str, str] | None:
+    """Return the IEEE address and normalized model of a Ubisys ZHA device.
+
+    Shared by the discovery scan and the device registry listener so both
+    apply the same candidate checks, cheapest first.
+
+    Args:
+        device_entry: Device registry entry
+
+    Returns:
+        (ieee, model) tuple, or None for non-Ubisys devices and devices
+        without a ZHA identifier
+    """
+    if device_entry.manufacturer not in UBISYS_MANUFACTURERS:
+        return None
+    ieee = extract_ieee_from_device(device_entry)
+    if ieee is None:
+        return None
+    return ieee, normalize_model(device_entry.model)
+
+
+async def _async_setup_all_input_monitoring(hass: HomeAssistant) -> None:
+    """Set up input monitoring for every configured entry concurrently.
+
+    Concurrency is capped so a large installation does not flood the ZHA
+    cluster request queue while platforms are still coming up.
+    """
+    semaphore = asyncio.Semaphore(_INPUT_MONITOR_SETUP_LIMIT)
+
+    async def _async_setup_one(entry_id: str) -> None:
+        async with semaphore:
+            await async_setup_input_monitoring(hass, entry_id)
+
+    entry_ids = [entry.entry_id for entry in hass.config_entries.async_entries(DOMAIN)]
+    # One failing device must not abort monitoring setup for the others
+    results = await asyncio.gather(
+        *(_async_setup_one(entry_id) for entry_id in entry_ids),
+        return_exceptions=True,
+    )
+    for entry_id, result in zip(entry_ids, results):
+        if isinstance(result, Exception):
+            _LOGGER.warning(
+                "Failed to set up input monitoring for entry %s: %s",
+                entry_id,
+                result,
+            )
+
+
 def async_setup_discovery(hass: HomeAssistant) -> None:
-    """Set up discovery and monitoring when Home Assistant starts."""
+    """Set up discovery and monitoring when Home Assistant starts.
+
+    Idempotent: a repeated call must not stack another set of registry
+    listeners, each of which would run for every registry event.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if domain_data.get("discovery_setup"):
+        _LOGGER.debug("Discovery already set up; skipping")
+        return
+    domain_data["discovery_setup"] = True
 
     @callback  # type: ignore[misc]
-    def async_setup_after_start(event: object) -> None:  # type: ignore[misc]
+    def async_setup_after_start(hass: HomeAssistant) -> None:  # type: ignore[misc]
         """Set up discovery and input monitoring when Home Assistant starts."""
-        hass.async_create_task(async_discover_devices(hass))
+        # Neither is needed for startup to complete, so run them as background
+        # tasks rather than holding up "startup wrap up"
+        device_registry = dr.async_get(hass)
+        if any(
+            device.manufacturer in UBISYS_MANUFACTURERS
+            for device in device_registry.devices.values()
+        ):
+            hass.async_create_background_task(
+                async_discover_devices(hass), name="ubisys_discover"
+            )
+        else:
+            # Devices paired later still trigger discovery via the device
+            # registry listener
+            _LOGGER.debug("No Ubisys devices registered; skipping initial discovery")
 
         # Set up input monitoring for all already-configured devices
-        for entry in hass.config_entries.async_entries(DOMAIN):
-            hass.async_create_task(async_setup_input_monitoring(hass, entry.entry_id))
+        if hass.config_entries.async_entries(DOMAIN):
+            hass.async_create_background_task(
+                _async_setup_all_input_monitoring(hass), name="ubisys_input_monitor"
+            )
+
+    # Unsubscribe callbacks, released by async_remove_discovery()
+    unsubs: list[CALLBACK_TYPE] = domain_data.setdefault("discovery_unsubs", [])
 
-    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, async_setup_after_start)
+    # Runs immediately if Home Assistant has already started (e.g. when the
+    # integration is added at runtime), otherwise once startup completes
+    unsubs.append(async_at_started(hass, async_setup_after_start))
 
     _async_setup_discovery_listeners(hass)
 
+    @_typed_callback
+    def _async_on_stop(event: HAEvent) -> None:
+        async_remove_discovery(hass)
+
+    # Not kept with the other unsubs: a one-time listener has already removed
+    # itself when it fires, and removing it again logs an error
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_on_stop)
+
+
+def async_remove_discovery(hass: HomeAssistant) -> None:
+    """Detach the discovery listeners and cancel any pending rescan.
+
+    Discovery has to keep running while no entries are configured (that is
+    when new devices get discovered), so this runs when Home Assistant stops
+    rather than when the last entry is unloaded.
+    """
+    domain_data = hass.data.get(DOMAIN, {})
+    for unsub in domain_data.pop("discovery_unsubs", ()):
+        unsub()
+    if (debouncer := domain_data.pop("discover_debouncer", None)) is not None:
+        debouncer.async_cancel()
+    domain_data.pop("discovery_setup", None)
+
 
 def _async_setup_discovery_listeners(hass: HomeAssistant) -> None:
     """Set up listeners for device and entity registry updates."""
+    # Registry events fire for every integration; bind the integration's data
+    # store once so the listeners below resolve it as a closure local
+    domain_data = hass.data.setdefault(DOMAIN, {})
+
+    # Set while a debounced scan runs. The debouncer drops calls that arrive
+    # then (its lock is held and no timer is pending), so a device created
+    # mid-scan queues one trailing scan instead.
+    scanning = False
+    rescan_requested = False
+
+    async def _async_discover() -> None:
+        nonlocal scanning, rescan_requested
+        scanning = True
+        try:
+            while True:
+                rescan_requested = False
+                await async_discover_devices(hass)
+                if not rescan_requested:
+                    break
+        finally:
+            scanning = False
+
+    # Re-pairing or a backup restore creates devices in bursts; the debouncer
+    # coalesces a burst into one discovery pass and never runs two at once
+    debouncer: Debouncer[Coroutine[Any, Any, None]] = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=DISCOVERY_DEBOUNCE_DELAY,
+        immediate=False,
+        function=_async_discover,
+    )
+    domain_data["discover_debouncer"] = debouncer
 
     # Also subscribe to device registry updates to discover devices paired
     # after startup without requiring a restart.
     @callback  # type: ignore[misc]
     def _device_registry_listener(event: HAEvent) -> None:  # type: ignore[misc]
-        try:
-            action = event.data.get("action")
-            device_id = event.data.get("device_id")
-
-            if not device_id:
-                return
-
-            # Handle device removal - cleanup orphaned entities
-            if action == "remove":
-                # Find the IEEE address for this device from our config entries
-                # (device is already deleted, so we can't query device registry)
-                ieee = None
-                for entry in hass.config_entries.async_entries(DOMAIN):
-                    if entry.data.get("device_id") == device_id:
-                        ieee = entry.data.get("device_ieee")
-                        break
-
-                if ieee:
-                    # Cleanup orphaned entities for this device (run in background)
-                    hass.async_create_task(async_cleanup_orphaned_entities(hass, ieee))
-
-                    _LOGGER.log(
-                        (
-                            logging.INFO
-                            if is_verbose_info_logging(hass)
-                            else logging.DEBUG
-                        ),
-                        "Device %s removed, cleaning up orphaned entities for IEEE %s",
-                        device_id,
-                        ieee,
-                    )
-                return
-
-            # Handle device creation - auto-discovery
-            if action != "create":
-                return
-
-            dev_reg = dr.async_get(hass)
-            device = dev_reg.async_get(device_id)
-            if not device or device.manufacturer != MANUFACTURER:
-                return
-            # Basic model normalization (strip parentheses suffix)
-            model = device.model.split("(")[0].strip() if device.model else ""
-            if model not in SUPPORTED_MODELS:
-                return
-            # Trigger config flow if not already configured
-            for entry in hass.config_entries.async_entries(DOMAIN):
-                if entry.data.get("device_ieee") == str(
-                    next(
-                        (idv for (idd, idv) in device.identifiers if idd == "zha"),
-                        "",
-                    )
-                ):
-                    return
-            _LOGGER.log(
-                logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
-                "Auto-discovering newly added Ubisys device: %s %s",
-                device.manufacturer,
-                model,
-            )
-            hass.async_create_task(async_discover_devices(hass))
-        except Exception:  # best-effort listener
-            _LOGGER.debug(
-                "Device registry listener encountered an error", exc_info=True
-            )
+        nonlocal rescan_requested
+        action = event.data.get("action")
+        device_id = event.data.get("device_id")
+
+        if not device_id:
+            return
+
+        # Handle device removal - cleanup orphaned entities
+        if action == "remove":
+            # Find the IEEE address for this device from our config entries
+            # (device is already deleted, so we can't query device registry)
+            entry = domain_data.get("entries_by_device_id", {}).get(device_id)
+            ieee = entry.data.get("device_ieee") if entry else None
+
+            if ieee:
+                # Cleanup orphaned entities for this device (run in background)
+                hass.async_create_task(async_cleanup_orphaned_entities(hass, ieee))
+
+                _LOGGER.log(
+                    verbose_info_log_level(hass),
+                    "Device %s removed, cleaning up orphaned entities for IEEE %s",
+                    device_id,
+                    ieee,
+                )
+            return
+
+        # Handle device creation - auto-discovery
+        if action != "create":
+            return
+
+        dev_reg = dr.async_get(hass)
+        device = dev_reg.async_get(device_id)
+        # Only schedule a scan for devices the scan would act on: supported
+        # Ubisys models with a ZHA identifier that are not configured yet
+        identity = _ubisys_zha_identity(device) if device else None
+        if identity is None:
+            return
+        ieee, model = identity
+        if model not in SUPPORTED_MODELS or ieee in domain_data.get(
+            "entries_by_ieee", {}
+        ):
+            return
+        _LOGGER.log(
+            verbose_info_log_level(hass),
+            "Auto-discovering newly added Ubisys device: %s %s",
+            device.manufacturer,
+            model,
+        )
+        if scanning:
+            rescan_requested = True
+        hass.async_create_background_task(
+            debouncer.async_call(), name="ubisys_discover_debounce"
+        )
 
-    if async_track_device_registry_updated_event is not None:
-        async_track_device_registry_updated_event(hass, _device_registry_listener)
-    else:
-        _LOGGER.debug("Device registry update listener helper not available; skipping")
+    unsubs: list[CALLBACK_TYPE] = domain_data.setdefault("discovery_unsubs", [])
+    unsubs.append(
+        hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED, _device_registry_listener
+        )
+    )
 
     # Register integration-level entity registry listener
     @callback  # type: ignore[misc]
     def _entity_registry_listener(event: HAEvent) -> None:  # type: ignore[misc]
         """Monitor entity registry updates and re-enable tracked ZHA entities."""
         try:
+            action = event.data.get("action")
+            changes = cast(dict[str, Any], event.data.get("changes", {}))
+            # Entities appearing, disappearing, being renamed or moving between
+            # devices make the cached device -> ZHA entity_id index stale
+            if action != "update" or "device_id" in changes or "entity_id" in changes:
+                invalidate_zha_entity_cache(hass)
+
             # Only process entity updates (not create/remove)
-            if event.data.get("action") != "update":
+            if action != "update":
                 return
 
             entity_id = event.data.get("entity_id")
@@ -250,8 +416,7 @@ def _async_setup_discovery_listeners(hass: HomeAssistant) -> None:
                 return
 
             # Check if this is a tracked ZHA entity
-            tracked = hass.data.get(DOMAIN, {}).get("tracked_zha_entities", set())
-            if entity_id not in tracked:
+            if entity_id not in domain_data.get("tracked_zha_entities", ()):
                 return
 
             # Check if entity was disabled by integration
@@ -284,4 +449,8 @@ def _async_setup_discovery_listeners(hass: HomeAssistant) -> None:
             )
 
     # Subscribe to entity registry updates
-    hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _entity_registry_listener)
+    unsubs.append(
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, _entity_registry_listener
+        )
+    )
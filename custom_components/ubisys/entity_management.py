@@ -20,6 +20,7 @@ from homeassistant.helpers import entity_registry as er
 
 from .const import (
     CONF_DEVICE_ID,
+    CONF_SHADE_TYPE,
     DOMAIN,
     MANUFACTURER,
     OPTION_VERBOSE_INFO_LOGGING,
@@ -29,6 +30,12 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# ZHA entity domain that each wrapped Ubisys device type replaces
+_DEVICE_TYPE_TO_DOMAIN: dict[str, str] = {
+    "window_covering": "cover",
+    "dimmer": "light",
+}
+
 
 async def async_cleanup_orphaned_entities(
     hass: HomeAssistant,
@@ -48,21 +55,42 @@ async def async_cleanup_orphaned_entities(
     Returns:
         Number of orphaned entities removed
     """
+    return await async_cleanup_orphaned_entities_batch(hass, {device_ieee})
+
+
+async def async_cleanup_orphaned_entities_batch(
+    hass: HomeAssistant,
+    device_ieees: set[str],
+) -> int:
+    """Clean up orphaned Ubisys entities for several devices in one pass.
+
+    Same criteria as async_cleanup_orphaned_entities(), but walks the entity
+    registry once for all devices instead of once per device.
+
+    Args:
+        hass: Home Assistant instance
+        device_ieees: IEEE addresses of the devices to clean up
+
+    Returns:
+        Number of orphaned entities removed
+    """
+    if not device_ieees:
+        return 0
+
     entity_registry = er.async_get(hass)
+    ieee_prefixes = tuple(device_ieees)
 
-    # Find orphaned entities for this device
+    # Find orphaned entities for these devices. The registry has no
+    # per-platform index, so order the filters cheapest and most selective
+    # first: nearly every entity is owned by a config entry.
     orphaned: list[str] = []
     for entity in entity_registry.entities.values():
-        # Only check Ubisys entities
-        if entity.platform != DOMAIN:
+        # Only orphans (no config entry) of Ubisys entities are of interest
+        if entity.config_entry_id is not None or entity.platform != DOMAIN:
             continue
 
-        # Check if entity belongs to this device (by IEEE in unique_id)
-        if not entity.unique_id or not entity.unique_id.startswith(device_ieee):
-            continue
-
-        # Check if orphaned (no config entry)
-        if entity.config_entry_id is None:
+        # Check if entity belongs to one of the devices (by IEEE in unique_id)
+        if entity.unique_id.startswith(ieee_prefixes):
             orphaned.append(entity.entity_id)
             _LOGGER.debug(
                 "Found orphaned entity: %s (unique_id: %s)",
@@ -70,7 +98,8 @@ async def async_cleanup_orphaned_entities(
                 entity.unique_id,
             )
 
-    # Remove orphaned entities
+    # Remove orphaned entities (collected first: removal mutates the registry
+    # mapping being iterated above)
     for entity_id in orphaned:
         entity_registry.async_remove(entity_id)
         _LOGGER.debug("Removed orphaned entity: %s", entity_id)
@@ -98,15 +127,10 @@ async def async_ensure_device_entry(
     model = entry.data["model"]
     name = entry.data["name"]
 
-    # First, try to find existing ZHA device by identifier
-    existing_device = None
-    for device in device_registry.devices.values():
-        for identifier_domain, identifier_value in device.identifiers:
-            if identifier_domain == "zha" and identifier_value == device_ieee:
-                existing_device = device
-                break
-        if existing_device:
-            break
+    # First, try to find existing ZHA device by identifier (indexed lookup)
+    existing_device = device_registry.async_get_device(
+        identifiers={("zha", device_ieee)}
+    )
 
     if existing_device:
         # ZHA device found - update it to include our config entry
@@ -116,18 +140,27 @@ async def async_ensure_device_entry(
             device_ieee,
         )
 
-        # Update device to add our config entry and ubisys identifier
-        device = device_registry.async_update_device(
-            existing_device.id,
-            add_config_entry_id=entry.entry_id,
-            merge_identifiers={(DOMAIN, device_ieee)},
-        )
+        # Update device to add our config entry and ubisys identifier. After
+        # the first setup both are already present; skip the registry write
+        # (and the store save it schedules) on every later restart.
+        device = existing_device
+        if (
+            entry.entry_id not in existing_device.config_entries
+            or (DOMAIN, device_ieee) not in existing_device.identifiers
+        ):
+            device = device_registry.async_update_device(
+                existing_device.id,
+                add_config_entry_id=entry.entry_id,
+                merge_identifiers={(DOMAIN, device_ieee)},
+            )
 
-        # Update config entry data to store correct device_id
-        hass.config_entries.async_update_entry(
-            entry,
-            data={**entry.data, CONF_DEVICE_ID: existing_device.id},
-        )
+        # Update config entry data to store correct device_id; only build the
+        # new data mapping when it actually changes
+        if entry.data.get(CONF_DEVICE_ID) != existing_device.id:
+            hass.config_entries.async_update_entry(
+                entry,
+                data={**entry.data, CONF_DEVICE_ID: existing_device.id},
+            )
     else:
         # No ZHA device found - create standalone device (fallback)
         _LOGGER.warning(
@@ -171,21 +204,22 @@ async def async_cleanup_orphaned_ubisys_device(
     """
     device_registry = dr.async_get(hass)
 
-    # Find orphaned Ubisys device (has our identifier but is not the correct device)
-    orphaned_device = None
-    for device in device_registry.devices.values():
-        # Skip the correct device
-        if device.id == correct_device_id:
-            continue
-
-        # Check if this device has ("ubisys", ieee) identifier
-        for identifier_domain, identifier_value in device.identifiers:
-            if identifier_domain == DOMAIN and identifier_value == device_ieee:
-                orphaned_device = device
-                break
-
-        if orphaned_device:
-            break
+    # Find orphaned Ubisys device (has our identifier but is not the correct
+    # device). Only devices still linked to our config entry need cleaning.
+    # The identifier index can't be used here: once the ZHA device has merged
+    # our identifier, the index points at the correct device and hides the
+    # orphan.
+    orphaned_device = next(
+        (
+            device
+            for device in dr.async_entries_for_config_entry(
+                device_registry, entry.entry_id
+            )
+            if device.id != correct_device_id
+            and (DOMAIN, device_ieee) in device.identifiers
+        ),
+        None,
+    )
 
     if not orphaned_device:
         return
@@ -213,67 +247,64 @@ async def async_cleanup_orphaned_ubisys_device(
         )
 
 
-async def async_hide_zha_entity(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Hide the original ZHA entity to prevent duplicate entities.
+def async_zha_entities_for_device(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry, device_id: str
+) -> list[er.RegistryEntry]:
+    """Return the ZHA registry entries attached to a device.
+
+    The device_id -> entity_id index is built from a single registry pass on
+    first use and dropped by the discovery entity registry listener whenever
+    ZHA entities are created, removed, renamed or moved between devices. Entries are
+    re-read from the registry so callers always see current state.
 
     Args:
         hass: Home Assistant instance
-        entry: Config entry for this device
+        entity_registry: Entity registry
+        device_id: Device registry ID of the ZHA device
+
+    Returns:
+        Registry entries of the ZHA entities for the device
     """
-    entity_registry = er.async_get(hass)
-    device_ieee = entry.data.get("device_ieee")
-    model = entry.data.get("model", "")
+    # Entries not linked to a device have no ZHA entities; don't build the
+    # index just to look up nothing
+    if not device_id:
+        return []
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    index: dict[str, list[str]] | None = domain_data.get("zha_entities_by_device")
+    if index is None:
+        index = {}
+        for entity_entry in entity_registry.entities.values():
+            if entity_entry.platform == "zha" and entity_entry.device_id:
+                index.setdefault(entity_entry.device_id, []).append(
+                    entity_entry.entity_id
+                )
+        domain_data["zha_entities_by_device"] = index
 
-    if not device_ieee:
-        _LOGGER.warning("No device IEEE in config entry, cannot hide ZHA entity")
-        return
+    return [
+        entity_entry
+        for entity_id in index.get(device_id, ())
+        if (entity_entry := entity_registry.async_get(entity_id)) is not None
+    ]
 
-    # Determine which domain to hide based on device type
-    device_type = get_device_type(model)
 
-    if device_type == "window_covering":
-        domain_to_hide = "cover"
-    elif device_type == "dimmer":
-        domain_to_hide = "light"
-    else:
-        _LOGGER.warning(
-            "Unknown device type '%s' for model '%s', cannot determine domain to hide",
-            device_type,
-            model,
-        )
-        return
+def invalidate_zha_entity_cache(hass: HomeAssistant) -> None:
+    """Drop the cached device_id -> ZHA entity index.
 
-    _LOGGER.debug(
-        "Hiding ZHA %s entity for device type %s (model %s)",
-        domain_to_hide,
-        device_type,
-        model,
-    )
+    Args:
+        hass: Home Assistant instance
+    """
+    hass.data.get(DOMAIN, {}).pop("zha_entities_by_device", None)
 
-    # Find the ZHA entity for this device
-    zha_entities = er.async_entries_for_config_entry(
-        entity_registry, entry.data.get("zha_config_entry_id", "")
-    )
 
-    for entity_entry in zha_entities:
-        # Look for matching platform and domain
-        if (
-            entity_entry.platform == "zha"
-            and entity_entry.domain == domain_to_hide
-            and entity_entry.device_id == entry.data.get("device_id")
-        ):
-            _LOGGER.debug(
-                "Hiding ZHA %s entity: %s (%s)",
-                domain_to_hide,
-                entity_entry.entity_id,
-                entity_entry.unique_id,
-            )
+async def async_hide_zha_entity(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Hide the original ZHA entity to prevent duplicate entities.
 
-            entity_registry.async_update_entity(
-                entity_entry.entity_id,
-                disabled_by=er.RegistryEntryDisabler.INTEGRATION,
-                hidden_by=er.RegistryEntryHider.INTEGRATION,
-            )
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry for this device
+    """
+    _async_set_zha_entity_visibility(hass, entry, hide=True)
 
 
 async def async_ensure_zha_entity_enabled(
@@ -286,23 +317,19 @@ async def async_ensure_zha_entity_enabled(
         entry: Config entry for this device
     """
     entity_registry = er.async_get(hass)
-    device_ieee = entry.data.get("device_ieee")
+    device_id = entry.data.get(CONF_DEVICE_ID)
     model = entry.data.get("model", "")
 
-    if not device_ieee:
+    if not device_id:
         _LOGGER.warning(
-            "No device IEEE in config entry, cannot ensure ZHA entity enabled"
+            "No device ID in config entry, cannot ensure ZHA entity enabled"
         )
         return
 
     # Determine which domain based on device type
     device_type = get_device_type(model)
-
-    if device_type == "window_covering":
-        domain = "cover"
-    elif device_type == "dimmer":
-        domain = "light"
-    else:
+    domain = _DEVICE_TYPE_TO_DOMAIN.get(device_type)
+    if domain is None:
         _LOGGER.warning(
             "Unknown device type '%s' for model '%s', cannot determine domain to enable",
             device_type,
@@ -311,23 +338,18 @@ async def async_ensure_zha_entity_enabled(
         return
 
     # Find the ZHA entity for this device
-    zha_entities = er.async_entries_for_config_entry(
-        entity_registry, entry.data.get("zha_config_entry_id", "")
-    )
+    zha_entities = async_zha_entities_for_device(hass, entity_registry, device_id)
 
     # Initialize tracked entities set if it doesn't exist
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN].setdefault("tracked_zha_entities", set())
+    tracked: set[str] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        "tracked_zha_entities", set()
+    )
 
     for entity_entry in zha_entities:
         # Look for matching platform and domain
-        if (
-            entity_entry.platform == "zha"
-            and entity_entry.domain == domain
-            and entity_entry.device_id == entry.data.get("device_id")
-        ):
+        if entity_entry.domain == domain:
             # Track this entity for ongoing monitoring
-            hass.data[DOMAIN]["tracked_zha_entities"].add(entity_entry.entity_id)
+            tracked.add(entity_entry.entity_id)
 
             # Re-enable if disabled by integration
             if entity_entry.disabled_by == er.RegistryEntryDisabler.INTEGRATION:
@@ -350,6 +372,9 @@ async def async_ensure_zha_entity_enabled(
                         err,
                     )
 
+            # A device exposes at most one ZHA entity per domain
+            break
+
 
 def async_untrack_zha_entities(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Remove ZHA entities for this config entry from tracking.
@@ -359,39 +384,29 @@ def async_untrack_zha_entities(hass: HomeAssistant, entry: ConfigEntry) -> None:
         entry: Config entry being unloaded
     """
     entity_registry = er.async_get(hass)
-    device_ieee = entry.data.get("device_ieee")
+    device_id = entry.data.get(CONF_DEVICE_ID)
     model = entry.data.get("model", "")
 
-    if not device_ieee:
+    if not device_id:
         return
 
-    device_type = get_device_type(model)
-
-    if device_type == "window_covering":
-        domain = "cover"
-    elif device_type == "dimmer":
-        domain = "light"
-    else:
+    domain = _DEVICE_TYPE_TO_DOMAIN.get(get_device_type(model))
+    if domain is None:
         return
 
-    zha_entities = er.async_entries_for_config_entry(
-        entity_registry, entry.data.get("zha_config_entry_id", "")
-    )
+    zha_entities = async_zha_entities_for_device(hass, entity_registry, device_id)
 
     tracked = hass.data.get(DOMAIN, {}).get("tracked_zha_entities", set())
 
     for entity_entry in zha_entities:
-        if (
-            entity_entry.platform == "zha"
-            and entity_entry.domain == domain
-            and entity_entry.device_id == entry.data.get("device_id")
-        ):
+        if entity_entry.domain == domain:
             tracked.discard(entity_entry.entity_id)
             _LOGGER.debug(
                 "Untracked ZHA %s entity: %s",
                 domain,
                 entity_entry.entity_id,
             )
+            break
 
 
 async def async_unhide_zha_entity(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -401,78 +416,190 @@ async def async_unhide_zha_entity(hass: HomeAssistant, entry: ConfigEntry) -> No
         hass: Home Assistant instance
         entry: Config entry for this device
     """
-    entity_registry = er.async_get(hass)
-    device_ieee = entry.data.get("device_ieee")
+    _async_set_zha_entity_visibility(hass, entry, hide=False)
+
+
+def _async_set_zha_entity_visibility(
+    hass: HomeAssistant, entry: ConfigEntry, *, hide: bool
+) -> None:
+    """Hide or unhide the ZHA entity wrapped by this config entry.
+
+    Hiding disables and hides the entity; unhiding reverts only what this
+    integration changed. Registry writes are skipped when the entity is
+    already in the requested state.
+
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry for this device
+        hide: True to hide the ZHA entity, False to unhide it
+    """
+    action = "hide" if hide else "unhide"
+    # The wrapped ZHA entity is matched by the HA device it belongs to
+    device_id = entry.data.get(CONF_DEVICE_ID)
     model = entry.data.get("model", "")
 
-    if not device_ieee:
-        _LOGGER.warning("No device IEEE in config entry, cannot unhide ZHA entity")
+    if not device_id:
+        _LOGGER.warning("No device ID in config entry, cannot %s ZHA entity", action)
         return
 
+    # Determine which domain to (un)hide based on device type
     device_type = get_device_type(model)
-
-    if device_type == "window_covering":
-        domain_to_unhide = "cover"
-    elif device_type == "dimmer":
-        domain_to_unhide = "light"
-    else:
+    domain = _DEVICE_TYPE_TO_DOMAIN.get(device_type)
+    if domain is None:
         _LOGGER.warning(
-            "Unknown device type '%s' for model '%s', cannot determine domain to unhide",
+            "Unknown device type '%s' for model '%s', cannot determine domain to %s",
             device_type,
             model,
+            action,
         )
         return
 
     _LOGGER.debug(
-        "Unhiding ZHA %s entity for device type %s (model %s)",
-        domain_to_unhide,
+        "%s ZHA %s entity for device type %s (model %s)",
+        "Hiding" if hide else "Unhiding",
+        domain,
         device_type,
         model,
     )
 
-    zha_entities = er.async_entries_for_config_entry(
-        entity_registry, entry.data.get("zha_config_entry_id", "")
-    )
-
-    for entity_entry in zha_entities:
-        if (
-            entity_entry.platform == "zha"
-            and entity_entry.domain == domain_to_unhide
-            and entity_entry.device_id == entry.data.get("device_id")
-            and entity_entry.hidden_by == er.RegistryEntryHider.INTEGRATION
-        ):
-            _LOGGER.debug(
-                "Unhiding ZHA %s entity: %s (%s)",
-                domain_to_unhide,
-                entity_entry.entity_id,
-                entity_entry.unique_id,
+    # Find the ZHA entity for this device (cached device-scoped lookup); a
+    # device exposes at most one ZHA entity per domain
+    entity_registry = er.async_get(hass)
+    entity_entry = next(
+        (
+            entity_entry
+            for entity_entry in async_zha_entities_for_device(
+                hass, entity_registry, device_id
             )
+            if entity_entry.domain == domain
+        ),
+        None,
+    )
+    if entity_entry is None:
+        return
 
-            updates: dict[str, Any] = {"hidden_by": None}
-            if entity_entry.disabled_by == er.RegistryEntryDisabler.INTEGRATION:
-                updates["disabled_by"] = None
+    updates: dict[str, Any]
+    if hide:
+        # Skip the registry write (and the update event it fires) if a
+        # previous run already hid the entity. disabled_by is not checked:
+        # async_ensure_zha_entity_enabled clears it again right after hiding,
+        # so a hidden entity is normally left enabled
+        if entity_entry.hidden_by == er.RegistryEntryHider.INTEGRATION:
+            return
+        updates = {
+            "disabled_by": er.RegistryEntryDisabler.INTEGRATION,
+            "hidden_by": er.RegistryEntryHider.INTEGRATION,
+        }
+    else:
+        if entity_entry.hidden_by != er.RegistryEntryHider.INTEGRATION:
+            return
+        updates = {"hidden_by": None}
+        if entity_entry.disabled_by == er.RegistryEntryDisabler.INTEGRATION:
+            updates["disabled_by"] = None
 
-            entity_registry.async_update_entity(
-                entity_entry.entity_id,
-                **updates,
-            )
+    _LOGGER.debug(
+        "%s ZHA %s entity: %s (%s)",
+        "Hiding" if hide else "Unhiding",
+        domain,
+        entity_entry.entity_id,
+        entity_entry.unique_id,
+    )
+    entity_registry.async_update_entity(entity_entry.entity_id, **updates)
 
 
 def recompute_verbose_flags(hass: HomeAssistant) -> None:
-    """Recompute and store global verbose logging flags from all entries."""
-    info = any(
-        entry.options.get(OPTION_VERBOSE_INFO_LOGGING, False)
-        for entry in hass.config_entries.async_entries(DOMAIN)
+    """Recompute and store global verbose logging flags from all entries.
+
+    Full scan used to seed the per-entry snapshots and running counters that
+    update_verbose_flags() maintains incrementally.
+    """
+    snapshots: dict[str, tuple[bool, bool]] = {}
+    info_count = input_count = 0
+    # Snapshots and both counters come out of a single pass over the entries
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        info, per_input = snapshots[entry.entry_id] = _verbose_options(entry)
+        info_count += info
+        input_count += per_input
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data["verbose_snapshots"] = snapshots
+    domain_data["verbose_info_count"] = info_count
+    domain_data["verbose_input_count"] = input_count
+    _store_verbose_flags(domain_data)
+
+
+def update_verbose_flags(
+    hass: HomeAssistant, entry: ConfigEntry, *, unloading: bool = False
+) -> None:
+    """Apply one entry's verbose option change to the global flags.
+
+    Adjusts the running counters by the difference between the entry's stored
+    snapshot and its current options, so the flags update in O(1) instead of
+    rescanning every entry. Falls back to a full recompute on first use.
+
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry whose options were set up, changed or unloaded
+        unloading: True if the entry no longer contributes to the flags
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    snapshots: dict[str, tuple[bool, bool]] | None = domain_data.get(
+        "verbose_snapshots"
     )
-    per_input = any(
-        entry.options.get(OPTION_VERBOSE_INPUT_LOGGING, False)
-        for entry in hass.config_entries.async_entries(DOMAIN)
+    if snapshots is None:
+        recompute_verbose_flags(hass)
+        snapshots = domain_data["verbose_snapshots"]
+        if not unloading:
+            return
+
+    old_info, old_input = snapshots.pop(entry.entry_id, (False, False))
+    new_info, new_input = (False, False) if unloading else _verbose_options(entry)
+    if not unloading:
+        snapshots[entry.entry_id] = (new_info, new_input)
+
+    # Most option updates (and most setups/unloads) don't touch the verbose
+    # options; leave the flags alone then
+    if (new_info, new_input) == (old_info, old_input):
+        return
+
+    domain_data["verbose_info_count"] += new_info - old_info
+    domain_data["verbose_input_count"] += new_input - old_input
+    _store_verbose_flags(domain_data)
+
+
+def _verbose_options(entry: ConfigEntry) -> tuple[bool, bool]:
+    """Return the (info, per-input) verbose logging options of an entry."""
+    return (
+        bool(entry.options.get(OPTION_VERBOSE_INFO_LOGGING, False)),
+        bool(entry.options.get(OPTION_VERBOSE_INPUT_LOGGING, False)),
     )
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN]["verbose_info_logging"] = info
-    hass.data[DOMAIN]["verbose_input_logging"] = per_input
+
+
+def _store_verbose_flags(domain_data: dict[str, Any]) -> None:
+    """Derive the global verbose flags from the running counters."""
+    domain_data["verbose_info_logging"] = domain_data["verbose_info_count"] > 0
+    domain_data["info_log_level"] = (
+        logging.INFO if domain_data["verbose_info_logging"] else logging.DEBUG
+    )
+    domain_data["verbose_input_logging"] = domain_data["verbose_input_count"] > 0
 
 
 async def options_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update by recomputing verbose flags."""
-    recompute_verbose_flags(hass)
+    """Handle options update by recomputing verbose flags.
+
+    A shade type change alters the cover's supported features, which are fixed
+    when the entity is created, so the entry is reloaded through the config
+    entry manager (which handles locking and state transitions for us).
+    """
+    update_verbose_flags(hass, entry)
+
+    # hass.data keeps the data mapping the entry was set up with
+    setup_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if setup_data is None:
+        return
+
+    if setup_data.get(CONF_SHADE_TYPE) != entry.data.get(CONF_SHADE_TYPE):
+        _LOGGER.debug(
+            "Shade type changed for %s; reloading config entry", entry.entry_id
+        )
+        await hass.config_entries.async_reload(entry.entry_id)
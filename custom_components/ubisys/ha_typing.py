@@ -18,7 +18,7 @@ try:
     # ignore_missing_imports, the imported decorator is typed as Any; casting
     # gives it a precise decorator type and avoids "untyped decorator" errors.
     callback = cast(Callable[[F], F], _ha_callback)
-except Exception:
+except ImportError:
     # Fallback no-op decorator for type checking without HA installed.
     def callback(func: F) -> F:
         return func
@@ -42,7 +42,12 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 
-from .const import DOMAIN, VERBOSE_INFO_LOGGING, VERBOSE_INPUT_LOGGING
+from .const import (
+    DOMAIN,
+    VERBOSE_INFO_LOGGING,
+    VERBOSE_INPUT_LOGGING,
+    normalize_model,
+)
 
 if TYPE_CHECKING:
     from zigpy.zcl import Cluster
@@ -76,24 +81,28 @@ def resolve_zha_gateway(zha_data: Any) -> Any | None:
         return None
 
     # Enhanced diagnostics to understand ZHA data structure
-    _LOGGER.debug(
-        "resolve_zha_gateway: zha_data type=%s, is_dict=%s",
-        type(zha_data).__name__,
-        isinstance(zha_data, dict),
-    )
-
-    if isinstance(zha_data, dict):
+    # (only built when DEBUG is enabled - dir() and the samples are not free)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
         _LOGGER.debug(
-            "resolve_zha_gateway: dict keys=%s",
-            list(zha_data.keys())[:10],  # Limit to first 10 keys
+            "resolve_zha_gateway: zha_data type=%s, is_dict=%s",
+            type(zha_data).__name__,
+            isinstance(zha_data, dict),
         )
-        # Show types of first few values
-        value_types = {k: type(v).__name__ for k, v in list(zha_data.items())[:3]}
-        _LOGGER.debug("resolve_zha_gateway: dict value types (sample)=%s", value_types)
-    else:
-        # Show object attributes
-        attrs = [attr for attr in dir(zha_data) if not attr.startswith("_")][:10]
-        _LOGGER.debug("resolve_zha_gateway: object attributes (sample)=%s", attrs)
+
+        if isinstance(zha_data, dict):
+            _LOGGER.debug(
+                "resolve_zha_gateway: dict keys=%s",
+                list(zha_data.keys())[:10],  # Limit to first 10 keys
+            )
+            # Show types of first few values
+            value_types = {k: type(v).__name__ for k, v in list(zha_data.items())[:3]}
+            _LOGGER.debug(
+                "resolve_zha_gateway: dict value types (sample)=%s", value_types
+            )
+        else:
+            # Show object attributes
+            attrs = [attr for attr in dir(zha_data) if not attr.startswith("_")][:10]
+            _LOGGER.debug("resolve_zha_gateway: object attributes (sample)=%s", attrs)
 
     def iter_candidates(obj: Any) -> list[Any]:
         values: list[Any] = [obj]
@@ -209,13 +218,9 @@ def extract_model_from_device(device: dr.DeviceEntry) -> str | None:
 
         Sharing prevents code duplication and ensures consistent parsing.
     """
-    if not device.model:
-        return None
-
     # Extract just the model code (e.g., "J1" from "J1 (5502)")
     # Handle both "J1" and "J1-R" formats
-    model: str = device.model.split("(")[0].strip()
-    return model if model else None
+    return normalize_model(device.model) or None
 
 
 def extract_ieee_from_device(device: dr.DeviceEntry) -> str | None:
@@ -247,6 +252,7 @@ def extract_ieee_from_device(device: dr.DeviceEntry) -> str | None:
         - device_trigger.py: Get device IEEE for event filtering
         - input_monitor.py: Get device IEEE for ZHA cluster access
         - config_flow.py: Validate device identity during setup
+        - discovery.py: Resolve the IEEE of discovered and newly added devices
 
         Sharing prevents code duplication and ensures consistent extraction.
     """
@@ -856,6 +862,19 @@ def is_verbose_info_logging(hass: HomeAssistant | None) -> bool:
         return VERBOSE_INFO_LOGGING
 
 
+def verbose_info_log_level(hass: HomeAssistant | None) -> int:
+    """Return the level for lifecycle logs: INFO when verbose, else DEBUG.
+
+    Uses the level cached alongside the runtime flags in hass.data[DOMAIN] so
+    hot paths resolve it with a single dict lookup.
+    """
+    if hass is not None:
+        level = hass.data.get(DOMAIN, {}).get("info_log_level")
+        if isinstance(level, int):
+            return level
+    return logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG
+
+
 def is_verbose_input_logging(hass: HomeAssistant | None) -> bool:
     """Return whether per-input INFO logs are enabled.
 
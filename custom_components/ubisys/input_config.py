@@ -131,7 +131,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import UBISYS_MANUFACTURER_CODE
-from .helpers import get_device_setup_cluster
+from .helpers import get_device_setup_cluster, verbose_info_log_level
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -848,10 +848,8 @@ async def async_apply_input_config(
         >>> micro_code = b"".join(a.to_bytes() for a in actions)
         >>> await async_apply_input_config(hass, ieee, micro_code)
     """
-    from .helpers import is_verbose_info_logging
-
     _LOGGER.log(
-        logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+        verbose_info_log_level(hass),
         "Applying InputActions configuration to %s",
         device_ieee,
     )
@@ -912,7 +910,7 @@ async def async_apply_input_config(
             )
 
         _LOGGER.log(
-            logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+            verbose_info_log_level(hass),
             "✓ InputActions configuration applied successfully",
         )
 
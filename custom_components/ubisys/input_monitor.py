@@ -34,8 +34,8 @@ from .helpers import (
     extract_ieee_from_device,
     extract_model_from_device,
     get_device_setup_cluster,
-    is_verbose_info_logging,
     is_verbose_input_logging,
+    verbose_info_log_level,
 )
 from .input_parser import InputActionRegistry, InputActionsParser, PressType
 from .logtools import Stopwatch, info_banner, kv
@@ -139,7 +139,7 @@ class UbisysInputMonitor:
             self._started = True
             kv(
                 _LOGGER,
-                logging.INFO if is_verbose_info_logging(self.hass) else logging.DEBUG,
+                verbose_info_log_level(self.hass),
                 "Input monitoring ready",
                 device_ieee=self.device_ieee,
                 model=self.model,
@@ -166,7 +166,7 @@ class UbisysInputMonitor:
 
         self._started = False
         _LOGGER.log(
-            logging.INFO if is_verbose_info_logging(self.hass) else logging.DEBUG,
+            verbose_info_log_level(self.hass),
             "Stopped input monitoring for %s",
             self.device_ieee,
         )
@@ -268,7 +268,7 @@ class UbisysInputMonitor:
             # Gate noisy INFO log unless verbose info logging is enabled
             kv(
                 _LOGGER,
-                logging.INFO if is_verbose_info_logging(self.hass) else logging.DEBUG,
+                verbose_info_log_level(self.hass),
                 "InputActions parsed",
                 count=len(actions),
                 device_ieee=self.device_ieee,
@@ -582,7 +582,7 @@ async def async_setup_input_monitoring(
     hass.data[DOMAIN].setdefault("input_monitors", []).extend(monitors)
 
     _LOGGER.log(
-        logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+        verbose_info_log_level(hass),
         "Set up input monitoring for %d devices",
         len(monitors),
     )
@@ -605,6 +605,6 @@ async def async_unload_input_monitoring(hass: HomeAssistant) -> None:
         del hass.data[DOMAIN]["input_monitors"]
 
     _LOGGER.log(
-        logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+        verbose_info_log_level(hass),
         "Unloaded input monitoring",
     )
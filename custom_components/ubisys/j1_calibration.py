@@ -29,14 +29,17 @@ import logging
 import time
 from typing import TYPE_CHECKING, cast
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, State
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_state_change_event
 
 from .const import (
     CONF_DEVICE_IEEE,
     CONF_SHADE_TYPE,
     DOMAIN,
+    EVENT_UBISYS_CALIBRATION_COMPLETE,
+    EVENT_UBISYS_CALIBRATION_FAILED,
     MODE_ATTR,
     MODE_CALIBRATION,
     MODE_NORMAL,
@@ -44,8 +47,8 @@ from .const import (
     SETTLE_TIME,
     SHADE_TYPE_TILT_STEPS,
     SHADE_TYPE_TO_WINDOW_COVERING_TYPE,
-    STALL_DETECTION_INTERVAL,
     STALL_DETECTION_TIME,
+    TOTAL_STEPS_READ_BACKOFF,
     UBISYS_ATTR_ADDITIONAL_STEPS,
     UBISYS_ATTR_INACTIVE_POWER_THRESHOLD,
     UBISYS_ATTR_INSTALLED_CLOSED_LIMIT_LIFT,
@@ -60,11 +63,15 @@ from .const import (
     UBISYS_ATTR_WINDOW_COVERING_TYPE,
     UBISYS_MANUFACTURER_CODE,
 )
+from .entity_management import async_zha_entities_for_device
+from .ha_typing import HAEvent
+from .ha_typing import callback as _typed_callback
 from .helpers import (
     async_write_and_verify_attrs,
     async_zcl_command,
     is_verbose_info_logging,
     resolve_zha_gateway,
+    verbose_info_log_level,
 )
 from .logtools import Stopwatch, info_banner, kv
 
@@ -205,6 +212,8 @@ async def async_calibrate_j1(hass: HomeAssistant, call: ServiceCall) -> None:
 
     successes: list[str] = []
     failures: dict[str, str] = {}
+    # Resolved once and shared by every entity in a multi-entity request
+    entity_registry = er.async_get(hass)
 
     for position, entity_id in enumerate(entity_ids, start=1):
         _LOGGER.debug(
@@ -214,7 +223,9 @@ async def async_calibrate_j1(hass: HomeAssistant, call: ServiceCall) -> None:
             entity_id,
         )
         try:
-            await _async_calibrate_single_entity(hass, entity_id, test_mode)
+            await _async_calibrate_single_entity(
+                hass, entity_registry, entity_id, test_mode
+            )
             successes.append(entity_id)
         except HomeAssistantError as err:
             failures[entity_id] = str(err)
@@ -312,6 +323,7 @@ async def async_tune_j1(hass: HomeAssistant, call: ServiceCall) -> None:
 
 async def _async_calibrate_single_entity(
     hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
     entity_id: str,
     test_mode: bool,
 ) -> None:
@@ -322,16 +334,17 @@ async def _async_calibrate_single_entity(
         raise HomeAssistantError("Missing required parameter: entity_id")
 
     _LOGGER.info("Starting calibration for entity: %s", entity_id)
+    # Derived once per request; reused by the start and completion notifications
+    notification_id = _get_notification_id(entity_id)
     try:
         hass.components.persistent_notification.create(
             title="Ubisys Calibration",
             message=f"Starting calibration for {entity_id}…",
-            notification_id=_get_notification_id(entity_id),
+            notification_id=notification_id,
         )
     except Exception:  # pragma: no cover - notifications are best-effort
         _LOGGER.debug("Unable to create start notification")
 
-    entity_registry = er.async_get(hass)
     entity_entry = entity_registry.async_get(entity_id)
     if not entity_entry:
         raise HomeAssistantError(f"Entity {entity_id} not found in registry")
@@ -349,15 +362,63 @@ async def _async_calibrate_single_entity(
     if not config_entry or config_entry.domain != DOMAIN:
         raise HomeAssistantError(f"Invalid config entry for entity: {entity_id}")
 
-    device_ieee = config_entry.data.get(CONF_DEVICE_IEEE)
-    shade_type = config_entry.data.get(CONF_SHADE_TYPE)
+    entry_data = config_entry.data
+    device_ieee = entry_data.get(CONF_DEVICE_IEEE)
+    shade_type = entry_data.get(CONF_SHADE_TYPE)
     if not device_ieee or not shade_type:
         raise HomeAssistantError("Missing device information in config entry")
 
-    zha_entity_id = await _find_zha_cover_entity(hass, entity_entry.device_id)
+    zha_entity_id = await _find_zha_cover_entity(
+        hass, entity_entry.device_id, entity_registry
+    )
     if not zha_entity_id:
         raise HomeAssistantError(f"ZHA cover entity not found for: {entity_id}")
 
+    # Share an identical request that is already running (double-tapped button,
+    # automation firing twice) instead of rejecting it or re-commissioning
+    hass.data.setdefault(DOMAIN, {})
+    in_flight: dict[tuple[str, bool], asyncio.Task[None]] = hass.data[
+        DOMAIN
+    ].setdefault("calibrations_in_flight", {})
+    request_key = (entity_id, test_mode)
+    running = in_flight.get(request_key)
+    if running is not None:
+        _LOGGER.info(
+            "Calibration request for %s already running - waiting for its result",
+            entity_id,
+        )
+        await asyncio.shield(running)
+        return
+
+    running = hass.async_create_task(
+        _async_run_calibration(
+            hass,
+            entity_id,
+            zha_entity_id,
+            device_ieee,
+            shade_type,
+            test_mode,
+            notification_id,
+        ),
+        name=f"ubisys_calibration_{entity_id}",
+    )
+    in_flight[request_key] = running
+    try:
+        await running
+    finally:
+        in_flight.pop(request_key, None)
+
+
+async def _async_run_calibration(
+    hass: HomeAssistant,
+    entity_id: str,
+    zha_entity_id: str,
+    device_ieee: str,
+    shade_type: str,
+    test_mode: bool,
+    notification_id: str,
+) -> None:
+    """Run the health check or full calibration under the per-device lock."""
     if test_mode:
         await _async_run_calibration_health_check(
             hass,
@@ -367,7 +428,6 @@ async def _async_calibrate_single_entity(
         )
         return
 
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN].setdefault("calibration_locks", {})
     locks: dict[str, asyncio.Lock] = hass.data[DOMAIN]["calibration_locks"]
     locks.setdefault(device_ieee, asyncio.Lock())
@@ -384,13 +444,13 @@ async def _async_calibrate_single_entity(
             "Acquired calibration lock for device %s - starting calibration",
             device_ieee,
         )
-        calibration_start = time.time()
+        calibration_start = time.monotonic()
         try:
             # Capture calibration results for diagnostics
             total_steps, total_steps2 = await _perform_calibration(
                 hass, zha_entity_id, device_ieee, shade_type
             )
-            elapsed = time.time() - calibration_start
+            elapsed = time.monotonic() - calibration_start
             _LOGGER.info(
                 "Calibration completed successfully for %s in %.1f seconds",
                 entity_id,
@@ -417,13 +477,11 @@ async def _async_calibrate_single_entity(
                 hass.components.persistent_notification.create(
                     title="Ubisys Calibration",
                     message=f"Calibration completed for {entity_id} in {elapsed:.1f}s.",
-                    notification_id=_get_notification_id(entity_id),
+                    notification_id=notification_id,
                 )
             except Exception:  # pragma: no cover
                 _LOGGER.debug("Unable to update success notification")
             try:
-                from .const import EVENT_UBISYS_CALIBRATION_COMPLETE
-
                 hass.bus.async_fire(
                     EVENT_UBISYS_CALIBRATION_COMPLETE,
                     {
@@ -446,7 +504,11 @@ async def _async_calibrate_single_entity(
             raise
 
 
-async def _find_zha_cover_entity(hass: HomeAssistant, device_id: str) -> str | None:
+async def _find_zha_cover_entity(
+    hass: HomeAssistant,
+    device_id: str,
+    entity_registry: er.EntityRegistry | None = None,
+) -> str | None:
     """Find the ZHA cover entity for a device.
 
     Searches the entity registry for the ZHA cover entity that corresponds
@@ -466,14 +528,15 @@ async def _find_zha_cover_entity(hass: HomeAssistant, device_id: str) -> str | N
 
     Search Strategy:
 
-        1. Get entity registry
-        2. Find all entities for this device_id
-        3. Filter for platform="zha" AND domain="cover"
-        4. Return first match (should only be one)
+        1. Get entity registry (reuse the caller's if provided)
+        2. Look up the device's ZHA entities in the cached device index
+           (no scan of the whole registry)
+        3. Return the first enabled cover (should only be one)
 
     Args:
         hass: Home Assistant instance for registry access
         device_id: Device ID from device registry
+        entity_registry: Already-resolved entity registry to reuse (optional)
 
     Returns:
         ZHA cover entity_id (e.g., "cover.bedroom_shade_2"), or None if not found
@@ -487,14 +550,21 @@ async def _find_zha_cover_entity(hass: HomeAssistant, device_id: str) -> str | N
         - async_calibrate_j1(): Calls this to find entity for monitoring
         - _wait_for_stall(): Uses this entity_id for position monitoring
     """
-    entity_registry = er.async_get(hass)
-    entities = er.async_entries_for_device(entity_registry, device_id)
-
-    for entity_entry in entities:
-        if entity_entry.platform == "zha" and entity_entry.domain == "cover":
-            return cast(str, entity_entry.entity_id)
-
-    return None
+    if entity_registry is None:
+        entity_registry = er.async_get(hass)
+    # The device index includes disabled entities; skip them as
+    # er.async_entries_for_device does by default. A disabled cover has no
+    # state, so stall detection could never watch it
+    return next(
+        (
+            cast(str, entity_entry.entity_id)
+            for entity_entry in async_zha_entities_for_device(
+                hass, entity_registry, device_id
+            )
+            if entity_entry.domain == "cover" and not entity_entry.disabled_by
+        ),
+        None,
+    )
 
 
 async def _validate_device_ready(hass: HomeAssistant, entity_id: str) -> None:
@@ -660,8 +730,6 @@ async def _handle_calibration_failure(
     except Exception as cleanup_err:  # pragma: no cover
         _LOGGER.error("Failed to exit calibration mode during cleanup: %s", cleanup_err)
     try:
-        from .const import EVENT_UBISYS_CALIBRATION_FAILED
-
         hass.bus.async_fire(
             EVENT_UBISYS_CALIBRATION_FAILED,
             {
@@ -848,7 +916,7 @@ async def _calibration_phase_1b_prepare_position(
 
     kv(
         _LOGGER,
-        logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+        verbose_info_log_level(hass),
         "PHASE 1B: Preparing starting position (Official Step 4)",
     )
 
@@ -883,7 +951,7 @@ async def _calibration_phase_1b_prepare_position(
 
     kv(
         _LOGGER,
-        logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+        verbose_info_log_level(hass),
         "PHASE 1B complete: Starting position prepared",
         elapsed_s=round(sw.elapsed, 1),
     )
@@ -963,7 +1031,7 @@ async def _calibration_phase_2_find_top(
     """
     kv(
         _LOGGER,
-        logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+        verbose_info_log_level(hass),
         "PHASE 2: Finding top limit (device auto-stop)",
     )
 
@@ -987,7 +1055,7 @@ async def _calibration_phase_2_find_top(
     await asyncio.sleep(SETTLE_TIME)
     kv(
         _LOGGER,
-        logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+        verbose_info_log_level(hass),
         "PHASE 2 complete: Top limit found",
     )
 
@@ -1090,7 +1158,7 @@ async def _calibration_phase_3_find_bottom(
     """
     kv(
         _LOGGER,
-        logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+        verbose_info_log_level(hass),
         "PHASE 3: Finding bottom limit",
     )
 
@@ -1111,26 +1179,18 @@ async def _calibration_phase_3_find_bottom(
     # Now it has calculated total_steps (full travel distance in motor steps).
     _LOGGER.debug("Step 8: Device auto-stopped at bottom - total_steps calculated")
 
+    # Let the device commit the new count first: on re-calibration TotalSteps
+    # cannot be reset to 0xFFFF, so an early read may return the previous
+    # (valid-looking) value
     await asyncio.sleep(SETTLE_TIME)
 
-    # Step 9: Read total_steps from device
+    # Step 9: Read total_steps from device (polled with backoff while the
+    # device still reports it as missing or uncalibrated)
     sw = Stopwatch()
     _LOGGER.debug("Step 9: Reading total_steps attribute from device")
     try:
-        result = await cluster.read_attributes(
-            [UBISYS_ATTR_TOTAL_STEPS],  # HA 2025.11+: Use attribute ID, not string name
-            manufacturer=UBISYS_MANUFACTURER_CODE,
-        )
-
-        # HA 2025.11+ returns tuple (success_dict, failure_dict)
-        if isinstance(result, tuple) and len(result) >= 1:
-            result = result[0]  # Extract success dict
-        elif isinstance(result, list) and result:
-            result = result[0]
-
-        # Handle both name and ID in response
-        total_steps = cast(
-            int | None, result.get("total_steps") or result.get(UBISYS_ATTR_TOTAL_STEPS)
+        total_steps = await _read_total_steps(
+            cluster, UBISYS_ATTR_TOTAL_STEPS, "total_steps"
         )
 
         if total_steps is None or total_steps == 0xFFFF:
@@ -1141,7 +1201,7 @@ async def _calibration_phase_3_find_bottom(
 
         kv(
             _LOGGER,
-            logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+            verbose_info_log_level(hass),
             "PHASE 3 complete",
             total_steps=total_steps,
             elapsed_s=round(sw.elapsed, 1),
@@ -1237,7 +1297,7 @@ async def _calibration_phase_4_verify(
     await asyncio.sleep(SETTLE_TIME)
     kv(
         _LOGGER,
-        logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+        verbose_info_log_level(hass),
         "PHASE 4 complete",
         result="verified",
     )
@@ -1459,8 +1519,9 @@ async def _perform_calibration(
             shade_type=shade_type,
         )
 
+    cluster: Cluster | None = None
     try:
-        overall_start = time.time()
+        overall_start = time.monotonic()
         # Pre-flight validation
         await _validate_device_ready(hass, zha_entity_id)
 
@@ -1483,7 +1544,7 @@ async def _perform_calibration(
         # Execute 5-phase calibration sequence (with Phase 1B pre-positioning)
         is_recalibration = await _calibration_phase_1_enter_mode(cluster, shade_type)
         # Total timeout enforcement across phases
-        if time.time() - overall_start > TOTAL_CALIBRATION_TIMEOUT:
+        if time.monotonic() - overall_start > TOTAL_CALIBRATION_TIMEOUT:
             raise HomeAssistantError(
                 "Calibration exceeded total timeout during Phase 1"
             )
@@ -1497,7 +1558,7 @@ async def _perform_calibration(
         )
 
         await _calibration_phase_1b_prepare_position(hass, cluster)
-        if time.time() - overall_start > TOTAL_CALIBRATION_TIMEOUT:
+        if time.monotonic() - overall_start > TOTAL_CALIBRATION_TIMEOUT:
             raise HomeAssistantError(
                 "Calibration exceeded total timeout during Phase 1B"
             )
@@ -1512,7 +1573,7 @@ async def _perform_calibration(
         )
 
         await _calibration_phase_2_find_top(hass, cluster, zha_entity_id)
-        if time.time() - overall_start > TOTAL_CALIBRATION_TIMEOUT:
+        if time.monotonic() - overall_start > TOTAL_CALIBRATION_TIMEOUT:
             raise HomeAssistantError(
                 "Calibration exceeded total timeout during Phase 2"
             )
@@ -1529,7 +1590,7 @@ async def _perform_calibration(
         total_steps = await _calibration_phase_3_find_bottom(
             hass, cluster, zha_entity_id
         )
-        if time.time() - overall_start > TOTAL_CALIBRATION_TIMEOUT:
+        if time.monotonic() - overall_start > TOTAL_CALIBRATION_TIMEOUT:
             raise HomeAssistantError(
                 "Calibration exceeded total timeout during Phase 3"
             )
@@ -1545,7 +1606,7 @@ async def _perform_calibration(
         )
 
         await _calibration_phase_4_verify(hass, cluster, zha_entity_id)
-        if time.time() - overall_start > TOTAL_CALIBRATION_TIMEOUT:
+        if time.monotonic() - overall_start > TOTAL_CALIBRATION_TIMEOUT:
             raise HomeAssistantError(
                 "Calibration exceeded total timeout during Phase 4"
             )
@@ -1582,16 +1643,7 @@ async def _perform_calibration(
             _LOGGER.debug(
                 "Reading TotalSteps2 (0x1004) for reverse-direction verification..."
             )
-            read_result = await cluster.read_attributes(
-                [UBISYS_ATTR_TOTAL_STEPS2],
-                manufacturer=UBISYS_MANUFACTURER_CODE,
-            )
-
-            # Handle tuple response format from zigpy
-            if isinstance(read_result, tuple) and len(read_result) >= 1:
-                read_result = read_result[0]
-
-            total_steps2 = read_result.get(UBISYS_ATTR_TOTAL_STEPS2)
+            total_steps2 = await _read_total_steps(cluster, UBISYS_ATTR_TOTAL_STEPS2)
 
             if total_steps2 is None or total_steps2 == 0xFFFF:
                 _LOGGER.warning(
@@ -1606,7 +1658,7 @@ async def _perform_calibration(
 
                 kv(
                     _LOGGER,
-                    logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+                    verbose_info_log_level(hass),
                     "Calibration measured both directions",
                     total_steps_down=total_steps,
                     total_steps_up=total_steps2,
@@ -1717,7 +1769,10 @@ async def _perform_calibration(
         # Attempt cleanup
         try:
             _LOGGER.debug("Attempting to exit calibration mode after error")
-            cluster = await _get_window_covering_cluster(hass, device_ieee)
+            # Reuse the cluster resolved for the run; only look it up again if
+            # the failure happened before that
+            if cluster is None:
+                cluster = await _get_window_covering_cluster(hass, device_ieee)
             if cluster:
                 await _exit_calibration_mode(cluster)
         except Exception as cleanup_err:
@@ -1884,6 +1939,57 @@ async def _exit_calibration_mode(cluster: Cluster) -> None:
         raise HomeAssistantError(f"Failed to exit calibration mode: {err}") from err
 
 
+async def _read_total_steps(
+    cluster: Cluster, attr_id: int, attr_name: str | None = None
+) -> int | None:
+    """Read a manufacturer-specific step count, polling until it is valid.
+
+    The device publishes TotalSteps/TotalSteps2 shortly after the motor stops.
+    Callers still settle first (a stale previous count cannot be told apart
+    from a fresh one); this only backs off (TOTAL_STEPS_READ_BACKOFF) while
+    the value is missing or 0xFFFF (uncalibrated) instead of failing outright.
+
+    Args:
+        cluster: WindowCovering cluster to read from
+        attr_id: Attribute ID to read (e.g. UBISYS_ATTR_TOTAL_STEPS)
+        attr_name: Optional attribute name some zigpy versions key results by
+
+    Returns:
+        The last value read (possibly None or 0xFFFF if it never became valid).
+        Read errors propagate to the caller.
+    """
+    value: int | None = None
+    for delay in (*TOTAL_STEPS_READ_BACKOFF, None):
+        result = await cluster.read_attributes(
+            [attr_id],  # HA 2025.11+: Use attribute ID, not string name
+            manufacturer=UBISYS_MANUFACTURER_CODE,
+        )
+
+        # HA 2025.11+ returns tuple (success_dict, failure_dict)
+        if isinstance(result, tuple) and len(result) >= 1:
+            result = result[0]  # Extract success dict
+        elif isinstance(result, list) and result:
+            result = result[0]
+
+        # Handle both name and ID in response
+        value = cast(
+            int | None,
+            (result.get(attr_name) if attr_name else None) or result.get(attr_id),
+        )
+        if value is not None and value != 0xFFFF:
+            return value
+        if delay is None:
+            break
+        _LOGGER.debug(
+            "Step count 0x%04X not ready (%s), retrying in %.2fs",
+            attr_id,
+            value,
+            delay,
+        )
+        await asyncio.sleep(delay)
+    return value
+
+
 async def _wait_for_motor_stop(
     cluster: Cluster,
     phase_description: str,
@@ -1991,14 +2097,14 @@ async def _wait_for_motor_stop(
         MOTOR_STATUS_POLL_INTERVAL,
     )
 
-    start_time = time.time()
+    start_time = time.monotonic()
     last_status = None
     last_log_time = start_time
     read_failures = 0
     MAX_READ_FAILURES = 5  # Allow up to 5 consecutive read failures before giving up
 
     while True:
-        current_time = time.time()
+        current_time = time.monotonic()
         elapsed = current_time - start_time
 
         # Check timeout
@@ -2150,16 +2256,13 @@ async def _wait_for_stall(
     STALL DETECTION ALGORITHM
     ═══════════════════════════════════════════════════════════════
 
-    1. Poll position attribute every STALL_DETECTION_INTERVAL (0.5s)
-    2. Compare current position to last known position
-    3. If unchanged:
-       - Start stall timer (if not already started)
-       - If timer reaches STALL_DETECTION_TIME (3s): declare stall
-    4. If position changes:
-       - Reset stall timer
-       - Update last_position
-       - Continue monitoring
-    5. If elapsed time exceeds timeout: raise error
+    1. Subscribe to state changes of the entity (no polling)
+    2. On each state change, compare current position to last known position
+       and wake the waiter only if it moved
+    3. Wait up to STALL_DETECTION_TIME (3s) for such a wake-up:
+       - Woken: reset the stall window and keep waiting
+       - Window expired: declare stall at the last known position
+    4. If elapsed time exceeds timeout: raise error
 
     Why 3 seconds for stall detection?
         - <2s: False positives if motor briefly pauses during movement
@@ -2167,10 +2270,10 @@ async def _wait_for_stall(
         - 3s: Balances reliability with user experience
         - Proven value from deCONZ implementation
 
-    Why 0.5s polling interval?
-        - Fast enough to detect stall promptly
-        - Slow enough to avoid excessive state polling
-        - Provides ~6 samples during 3s stall window
+    Why event-driven instead of polling?
+        - No idle wake-ups while the motor runs (up to 120s per move)
+        - Stall is detected exactly STALL_DETECTION_TIME after the last
+          reported position change, not on a polling grid
 
     Why 120s timeout?
         - Allows for very large blinds or slow motors
@@ -2220,85 +2323,82 @@ async def _wait_for_stall(
         STALL_DETECTION_TIME,
     )
 
-    start_time = time.time()
-    last_position = None
-    stall_start_time = None
-    last_log_time = start_time
-
-    while True:
-        current_time = time.time()
-        elapsed = current_time - start_time
-
-        # Check timeout
-        if elapsed > timeout:
-            raise HomeAssistantError(
-                f"Timeout during {phase_description} after {elapsed:.1f}s. "
-                f"Last position: {last_position}. "
-                f"Motor may be jammed, disconnected, or moving very slowly."
-            )
+    state = hass.states.get(entity_id)
+    if not state:
+        raise HomeAssistantError(f"Entity not found during calibration: {entity_id}")
 
-        # Get current state
-        state = hass.states.get(entity_id)
-        if not state:
-            raise HomeAssistantError(
-                f"Entity not found during calibration: {entity_id}"
+    start_time = time.monotonic()
+    last_log_time = start_time
+    last_position = state.attributes.get("current_position")
+    position_changed = asyncio.Event()
+
+    @_typed_callback
+    def _async_position_update(event: HAEvent) -> None:
+        """Wake the waiter when the reported position moves (or entity goes)."""
+        nonlocal last_position
+        new_state = cast(State | None, event.data.get("new_state"))
+        if new_state is None:
+            position_changed.set()
+            return
+        position = new_state.attributes.get("current_position")
+        if position != last_position:
+            _LOGGER.debug(
+                "%s: Position changed from %s to %s (elapsed: %.1fs)",
+                phase_description,
+                last_position,
+                position,
+                time.monotonic() - start_time,
             )
+            last_position = position
+            position_changed.set()
 
-        current_position = state.attributes.get("current_position")
-
-        if current_position is None:
-            _LOGGER.warning(
-                "No current_position attribute during %s, waiting...", phase_description
-            )
-            await asyncio.sleep(STALL_DETECTION_INTERVAL)
-            continue
-
-        # Check if position has changed
-        if current_position == last_position:
-            # Position unchanged
-            if stall_start_time is None:
-                stall_start_time = current_time
-                _LOGGER.debug(
-                    "%s: Position stable at %s, starting stall timer",
-                    phase_description,
-                    current_position,
-                )
-            else:
-                stall_duration = current_time - stall_start_time
-                if stall_duration >= STALL_DETECTION_TIME:
-                    # Stalled! Motor has reached limit
+    unsub = async_track_state_change_event(hass, [entity_id], _async_position_update)
+    try:
+        async with asyncio.timeout(timeout):
+            while True:
+                try:
+                    await asyncio.wait_for(
+                        position_changed.wait(), timeout=STALL_DETECTION_TIME
+                    )
+                except TimeoutError:
+                    if last_position is None:
+                        _LOGGER.warning(
+                            "No current_position attribute during %s, waiting...",
+                            phase_description,
+                        )
+                        continue
                     _LOGGER.info(
                         "%s: Motor stalled at position %s after %.1fs",
                         phase_description,
-                        current_position,
-                        stall_duration,
+                        last_position,
+                        time.monotonic() - start_time,
                     )
-                    return int(current_position)
-        else:
-            # Position changed - motor still moving
-            if last_position is not None:
-                _LOGGER.debug(
-                    "%s: Position changed from %s to %s (elapsed: %.1fs)",
-                    phase_description,
-                    last_position,
-                    current_position,
-                    elapsed,
-                )
-            stall_start_time = None
-            last_position = current_position
+                    return int(last_position)
 
-        # Log progress every 5 seconds
-        if current_time - last_log_time >= 5.0:
-            _LOGGER.info(
-                "%s: Still moving, position=%s, elapsed=%.1fs",
-                phase_description,
-                current_position,
-                elapsed,
-            )
-            last_log_time = current_time
+                position_changed.clear()
+                if hass.states.get(entity_id) is None:
+                    raise HomeAssistantError(
+                        f"Entity not found during calibration: {entity_id}"
+                    )
 
-        # Wait before next check
-        await asyncio.sleep(STALL_DETECTION_INTERVAL)
+                current_time = time.monotonic()
+                if current_time - last_log_time >= 5.0:
+                    _LOGGER.info(
+                        "%s: Still moving, position=%s, elapsed=%.1fs",
+                        phase_description,
+                        last_position,
+                        current_time - start_time,
+                    )
+                    last_log_time = current_time
+    except TimeoutError as err:
+        raise HomeAssistantError(
+            f"Timeout during {phase_description} after "
+            f"{time.monotonic() - start_time:.1f}s. "
+            f"Last position: {last_position}. "
+            f"Motor may be jammed, disconnected, or moving very slowly."
+        ) from err
+    finally:
+        unsub()
 
 
 async def _get_window_covering_cluster(
@@ -2411,11 +2511,12 @@ async def _get_window_covering_cluster(
         endpoint = device.endpoints.get(1)
         if endpoint:
             # Debug: Log endpoint attributes to understand new API structure
-            _LOGGER.debug(
-                "Endpoint object type=%s, attributes=%s",
-                type(endpoint).__name__,
-                [attr for attr in dir(endpoint) if not attr.startswith("_")][:20],
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Endpoint object type=%s, attributes=%s",
+                    type(endpoint).__name__,
+                    [attr for attr in dir(endpoint) if not attr.startswith("_")][:20],
+                )
 
             # Try multiple cluster access patterns for compatibility
             cluster = None
@@ -2446,7 +2547,7 @@ async def _get_window_covering_cluster(
                 )
             if cluster:
                 _LOGGER.log(
-                    logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+                    verbose_info_log_level(hass),
                     "✓ Found WindowCovering cluster on endpoint 1 (server)",
                 )
                 return cluster
@@ -2471,7 +2572,7 @@ async def _get_window_covering_cluster(
                 )
             if cluster:
                 _LOGGER.log(
-                    logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+                    verbose_info_log_level(hass),
                     "✓ Found WindowCovering cluster on endpoint 2 (controller)",
                 )
                 return cluster
@@ -41,16 +41,18 @@ from homeassistant.components.light import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 
 from .const import (
     CONF_DEVICE_ID,
     CONF_DEVICE_IEEE,
+    DIMMER_MODELS,
     DOMAIN,
 )
 from .ha_typing import callback as _typed_callback
-from .helpers import is_verbose_info_logging
+from .helpers import verbose_info_log_level
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -96,8 +98,6 @@ async def async_setup_entry(
 
     # Only create light entities for D1/D1-R dimmer models
     # J1 devices are covers, S1 devices are switches
-    from .const import DIMMER_MODELS
-
     if model not in DIMMER_MODELS:
         _LOGGER.debug(
             "Skipping light entity for non-dimmer device: model=%s (ieee=%s)",
@@ -126,7 +126,7 @@ async def async_setup_entry(
         return
 
     _LOGGER.log(
-        logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+        verbose_info_log_level(hass),
         "Creating Ubisys light wrapper for %s (ZHA entity: %s, model: %s)",
         device_ieee,
         zha_entity_id,
@@ -255,8 +255,15 @@ class UbisysLight(LightEntity):
         self._attr_unique_id = f"{device_ieee}_light"
 
         # Set device info (links this entity to the device)
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_ieee)},
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, device_ieee)})
+
+        # Entity-specific state attributes, fixed for the entity's lifetime.
+        # Useful for debugging (which ZHA entity we wrap) and for automations
+        # filtering by model.
+        self._attr_extra_state_attributes = {
+            "model": model,
+            "zha_entity_id": zha_entity_id,
+            "integration": "ubisys",
         }
 
         # D1 supports brightness control only (not color)
@@ -367,31 +374,6 @@ class UbisysLight(LightEntity):
             self._attr_brightness,
         )
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return entity-specific state attributes.
-
-        These attributes appear in the entity's state and are useful for:
-        - Debugging (seeing which ZHA entity we're wrapping)
-        - Automations (filtering by model)
-        - User information
-
-        Returns:
-            Dictionary of additional attributes
-
-        Example State:
-            {
-                "model": "D1",
-                "zha_entity_id": "light.bedroom_d1_2",
-                "integration": "ubisys"
-            }
-        """
-        return {
-            "model": self._model,
-            "zha_entity_id": self._zha_entity_id,
-            "integration": "ubisys",
-        }
-
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on.
 
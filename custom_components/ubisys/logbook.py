@@ -0,0 +1,59 @@
+"""Logbook platform for the Ubisys integration.
+
+Home Assistant's logbook integration discovers this module and calls
+async_describe_events() once, so Ubisys events show up as readable
+entries instead of raw event names.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, EVENT_UBISYS_CALIBRATION_COMPLETE, EVENT_UBISYS_INPUT
+from .ha_typing import HAEvent
+
+# Logbook entry keys (LOGBOOK_ENTRY_NAME / LOGBOOK_ENTRY_MESSAGE)
+_NAME = "name"
+_MESSAGE = "message"
+
+DescribeEventCallback = Callable[[HAEvent], dict[str, str]]
+
+
+def _describe_calibration_event(event: HAEvent) -> dict[str, str]:
+    """Describe a calibration completion event for the logbook."""
+    data = event.data
+    return {
+        _NAME: "Ubisys",
+        _MESSAGE: (
+            f"calibration completed ({data.get('shade_type', 'unknown')}) "
+            f"in {data.get('duration_s', '?')}s"
+        ),
+    }
+
+
+def _describe_input_event(event: HAEvent) -> dict[str, str]:
+    """Describe a physical input event for the logbook."""
+    data = event.data
+    return {
+        _NAME: "Ubisys",
+        _MESSAGE: (
+            f"input {data.get('press_type', 'unknown')} "
+            f"on input {data.get('input_number', '?')}"
+        ),
+    }
+
+
+def async_describe_events(
+    hass: HomeAssistant,
+    async_describe_event: Callable[[str, str, DescribeEventCallback], None],
+) -> None:
+    """Register describers for the events this integration fires.
+
+    Called synchronously from the event loop by the logbook integration.
+    """
+    async_describe_event(
+        DOMAIN, EVENT_UBISYS_CALIBRATION_COMPLETE, _describe_calibration_event
+    )
+    async_describe_event(DOMAIN, EVENT_UBISYS_INPUT, _describe_input_event)
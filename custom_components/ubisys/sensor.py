@@ -14,6 +14,7 @@ from typing import Any, Deque, Mapping
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -49,7 +50,7 @@ class UbisysLastInputEventSensor(SensorEntity):
         self._device_ieee = device_ieee
         self._device_id = entry.data.get("device_id")
         self._attr_unique_id = f"{device_ieee}_last_input"
-        self._attr_device_info = {"identifiers": {(DOMAIN, device_ieee)}}
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, device_ieee)})
         self._attr_extra_state_attributes: dict[str, Any] = {}
         self._history: Deque[dict[str, Any]] = deque(maxlen=10)
         self._unsubscribe: Any | None = None
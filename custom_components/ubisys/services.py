@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Awaitable, Callable
+from functools import partial
 from typing import Any
 
 import voluptuous as vol
@@ -19,207 +20,215 @@ from homeassistant.helpers import config_validation as cv
 
 from .cleanup import async_cleanup_orphans
 from .const import (
+    BALLAST_LEVEL_MAX,
+    BALLAST_LEVEL_MIN,
     DOMAIN,
+    PHASE_MODES,
     SERVICE_CALIBRATE_COVER,
     SERVICE_CONFIGURE_D1_BALLAST,
     SERVICE_CONFIGURE_D1_PHASE_MODE,
     SERVICE_TUNE_J1_ADVANCED,
 )
-from .d1_config import async_configure_ballast, async_configure_phase_mode
-from .helpers import is_verbose_info_logging
-from .j1_calibration import async_calibrate_j1, async_tune_j1
+from .helpers import verbose_info_log_level
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def async_setup_services(hass: HomeAssistant) -> None:
-    """Register all Ubisys services."""
+# -----------------------------------------------------------------------------
+# Service schemas (compiled once at import rather than on every setup)
+# -----------------------------------------------------------------------------
 
-    # -------------------------------------------------------------------------
-    # J1 Calibration Service
-    # -------------------------------------------------------------------------
-    _LOGGER.debug("Registering J1 calibration service: %s", SERVICE_CALIBRATE_COVER)
-
-    async def _calibrate_j1_handler(call: ServiceCall) -> None:
-        """Wrapper to inject hass into calibration handler."""
-        await async_calibrate_j1(hass, call)
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CALIBRATE_COVER,
-        _calibrate_j1_handler,
-        schema=vol.Schema(
-            {
-                vol.Required("entity_id"): cv.entity_ids,
-                vol.Optional("test_mode", default=False): cv.boolean,
-            }
+_CALIBRATE_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_ids,
+        vol.Optional("test_mode", default=False): cv.boolean,
+    }
+)
+
+_TUNE_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_ids,
+        vol.Optional("turnaround_guard_time"): cv.positive_int,
+        vol.Optional("inactive_power_threshold"): cv.positive_int,
+        vol.Optional("startup_steps"): cv.positive_int,
+        vol.Optional("additional_steps"): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=100)
         ),
-    )
+        vol.Optional("input_actions"): cv.string,
+    }
+)
 
-    # -------------------------------------------------------------------------
-    # J1 Advanced Tuning Service
-    # -------------------------------------------------------------------------
-    _LOGGER.debug(
-        "Registering J1 advanced tuning service: %s", SERVICE_TUNE_J1_ADVANCED
-    )
+# Shared by both ballast level fields
+_LEVEL_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.Range(min=BALLAST_LEVEL_MIN, max=BALLAST_LEVEL_MAX)
+)
 
-    async def _tune_j1_handler(call: ServiceCall) -> None:
-        """Wrapper to inject hass into tuning handler."""
-        await async_tune_j1(hass, call)
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_TUNE_J1_ADVANCED,
-        _tune_j1_handler,
-        schema=vol.Schema(
-            {
-                vol.Required("entity_id"): cv.entity_ids,
-                vol.Optional("turnaround_guard_time"): cv.positive_int,
-                vol.Optional("inactive_power_threshold"): cv.positive_int,
-                vol.Optional("startup_steps"): cv.positive_int,
-                vol.Optional("additional_steps"): vol.All(
-                    vol.Coerce(int), vol.Range(min=0, max=100)
-                ),
-                vol.Optional("input_actions"): cv.string,
-            }
-        ),
-    )
+_PHASE_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_ids,
+        vol.Required("phase_mode"): vol.In(PHASE_MODES),
+    }
+)
 
-    # -------------------------------------------------------------------------
-    # D1 Configuration Services
-    # -------------------------------------------------------------------------
-    _LOGGER.debug(
-        "Registering D1 phase mode service: %s", SERVICE_CONFIGURE_D1_PHASE_MODE
-    )
+_BALLAST_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_ids,
+        vol.Optional("min_level"): _LEVEL_VALIDATOR,
+        vol.Optional("max_level"): _LEVEL_VALIDATOR,
+    }
+)
 
-    async def _configure_phase_mode_handler(call: ServiceCall) -> None:
-        """Wrapper to inject hass and extract parameters from call."""
-        entity_ids = _normalize_entity_ids(call.data.get("entity_id"))
-        phase_mode = call.data.get("phase_mode")
-        if phase_mode is None:
-            raise HomeAssistantError("Missing required parameter: phase_mode")
+_CLEANUP_SCHEMA = vol.Schema(
+    {
+        vol.Optional("dry_run", default=False): cv.boolean,
+    }
+)
 
-        async def runner(entity_id: str) -> None:
-            await async_configure_phase_mode(hass, entity_id, phase_mode)
 
-        await _run_multi_entity_service(entity_ids, runner)
+# -----------------------------------------------------------------------------
+# Service handlers
+# -----------------------------------------------------------------------------
+# The device modules are large and only needed once a service is called, so
+# they are imported on first use rather than when the integration loads.
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CONFIGURE_D1_PHASE_MODE,
-        _configure_phase_mode_handler,
-        schema=vol.Schema(
-            {
-                vol.Required("entity_id"): cv.entity_ids,
-                vol.Required("phase_mode"): vol.In(["automatic", "forward", "reverse"]),
-            }
-        ),
-    )
 
-    _LOGGER.debug("Registering D1 ballast service: %s", SERVICE_CONFIGURE_D1_BALLAST)
-
-    async def _configure_ballast_handler(call: ServiceCall) -> None:
-        """Wrapper to inject hass and extract parameters from call."""
-        entity_ids = _normalize_entity_ids(call.data.get("entity_id"))
-        min_level = call.data.get("min_level")
-        max_level = call.data.get("max_level")
-
-        async def runner(entity_id: str) -> None:
-            await async_configure_ballast(hass, entity_id, min_level, max_level)
-
-        await _run_multi_entity_service(entity_ids, runner)
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CONFIGURE_D1_BALLAST,
-        _configure_ballast_handler,
-        schema=vol.Schema(
-            {
-                vol.Required("entity_id"): cv.entity_ids,
-                vol.Optional("min_level"): vol.All(
-                    vol.Coerce(int), vol.Range(min=1, max=254)
-                ),
-                vol.Optional("max_level"): vol.All(
-                    vol.Coerce(int), vol.Range(min=1, max=254)
-                ),
-            }
-        ),
-    )
+async def _async_calibrate_j1_service(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Run J1 calibration for the requested entities."""
+    from .j1_calibration import async_calibrate_j1
+
+    await async_calibrate_j1(hass, call)
+
+
+async def _async_tune_j1_service(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Apply J1 advanced tuning for the requested entities."""
+    from .j1_calibration import async_tune_j1
+
+    await async_tune_j1(hass, call)
+
 
-    # -------------------------------------------------------------------------
-    # Orphan Cleanup Service
-    # -------------------------------------------------------------------------
-    _LOGGER.debug("Registering orphan cleanup service: ubisys.cleanup_orphans")
-
-    async def _cleanup_orphans_service(call: ServiceCall) -> None:
-        """Clean up orphaned Ubisys devices and entities."""
-        result = await async_cleanup_orphans(hass, call)
-
-        dry_run = result.get("dry_run", False)
-        devices_count = len(result.get("orphaned_devices", []))
-        entities_count = len(result.get("orphaned_entities", []))
-
-        if dry_run:
-            # Dry run - show what would be cleaned
-            _LOGGER.info(
-                "Dry run: Found %d orphaned devices and %d orphaned entities",
-                devices_count,
-                entities_count,
+async def _async_configure_phase_mode_service(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Extract parameters from call and configure D1 phase mode per entity."""
+    from .d1_config import async_configure_phase_mode
+
+    entity_ids = _normalize_entity_ids(call.data.get("entity_id"))
+    phase_mode = call.data.get("phase_mode")
+    if phase_mode is None:
+        raise HomeAssistantError("Missing required parameter: phase_mode")
+
+    async def runner(entity_id: str) -> None:
+        await async_configure_phase_mode(hass, entity_id, phase_mode)
+
+    await _run_multi_entity_service(entity_ids, runner)
+
+
+async def _async_configure_ballast_service(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Extract parameters from call and configure D1 ballast per entity."""
+    from .d1_config import async_configure_ballast
+
+    entity_ids = _normalize_entity_ids(call.data.get("entity_id"))
+    min_level = call.data.get("min_level")
+    max_level = call.data.get("max_level")
+
+    async def runner(entity_id: str) -> None:
+        await async_configure_ballast(hass, entity_id, min_level, max_level)
+
+    await _run_multi_entity_service(entity_ids, runner)
+
+
+async def _async_cleanup_orphans_service(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Clean up orphaned Ubisys devices and entities."""
+    result = await async_cleanup_orphans(hass, call)
+
+    dry_run = result.get("dry_run", False)
+    devices_count = len(result.get("orphaned_devices", []))
+    entities_count = len(result.get("orphaned_entities", []))
+
+    if dry_run:
+        # Dry run - show what would be cleaned
+        _LOGGER.info(
+            "Dry run: Found %d orphaned devices and %d orphaned entities",
+            devices_count,
+            entities_count,
+        )
+
+        try:
+            message = f"Found {devices_count} orphaned devices and {entities_count} orphaned entities.\n"
+            message += "Run without dry_run=true to remove them."
+
+            await hass.services.async_call(
+                "persistent_notification",
+                "create",
+                {
+                    "message": message,
+                    "title": "Ubisys Cleanup Preview",
+                    "notification_id": "ubisys_cleanup_preview",
+                },
             )
+        except Exception:
+            _LOGGER.debug("Could not create notification", exc_info=True)
+    else:
+        # Actual cleanup - show results
+        _LOGGER.log(
+            verbose_info_log_level(hass),
+            "Cleanup completed: removed %d devices and %d entities",
+            devices_count,
+            entities_count,
+        )
 
+        if devices_count > 0 or entities_count > 0:
             try:
-                message = f"Found {devices_count} orphaned devices and {entities_count} orphaned entities.\n"
-                message += "Run without dry_run=true to remove them."
+                message = f"Removed {devices_count} orphaned devices and {entities_count} orphaned entities."
 
                 await hass.services.async_call(
                     "persistent_notification",
                     "create",
                     {
                         "message": message,
-                        "title": "Ubisys Cleanup Preview",
-                        "notification_id": "ubisys_cleanup_preview",
+                        "title": "Ubisys Cleanup Complete",
+                        "notification_id": "ubisys_cleanup_complete",
                     },
                 )
             except Exception:
                 _LOGGER.debug("Could not create notification", exc_info=True)
-        else:
-            # Actual cleanup - show results
-            _LOGGER.log(
-                logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
-                "Cleanup completed: removed %d devices and %d entities",
-                devices_count,
-                entities_count,
-            )
 
-            if devices_count > 0 or entities_count > 0:
-                try:
-                    message = f"Removed {devices_count} orphaned devices and {entities_count} orphaned entities."
-
-                    await hass.services.async_call(
-                        "persistent_notification",
-                        "create",
-                        {
-                            "message": message,
-                            "title": "Ubisys Cleanup Complete",
-                            "notification_id": "ubisys_cleanup_complete",
-                        },
-                    )
-                except Exception:
-                    _LOGGER.debug("Could not create notification", exc_info=True)
-
-    hass.services.async_register(
-        DOMAIN,
-        "cleanup_orphans",
-        _cleanup_orphans_service,
-        schema=vol.Schema(
-            {
-                vol.Optional("dry_run", default=False): cv.boolean,
-            }
-        ),
-    )
+
+# Service name -> (handler taking hass and the call, schema). ServiceCall does
+# not carry hass on every supported core, so it is bound at registration.
+_SERVICES: tuple[
+    tuple[str, Callable[[HomeAssistant, ServiceCall], Awaitable[None]], vol.Schema],
+    ...,
+] = (
+    # J1: calibration and advanced tuning
+    (SERVICE_CALIBRATE_COVER, _async_calibrate_j1_service, _CALIBRATE_SCHEMA),
+    (SERVICE_TUNE_J1_ADVANCED, _async_tune_j1_service, _TUNE_SCHEMA),
+    # D1: phase mode and ballast configuration
+    (
+        SERVICE_CONFIGURE_D1_PHASE_MODE,
+        _async_configure_phase_mode_service,
+        _PHASE_SCHEMA,
+    ),
+    (SERVICE_CONFIGURE_D1_BALLAST, _async_configure_ballast_service, _BALLAST_SCHEMA),
+    # System: orphan cleanup
+    ("cleanup_orphans", _async_cleanup_orphans_service, _CLEANUP_SCHEMA),
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register all Ubisys services."""
+    for service, handler, schema in _SERVICES:
+        _LOGGER.debug("Registering service: %s.%s", DOMAIN, service)
+        hass.services.async_register(
+            DOMAIN, service, partial(handler, hass), schema=schema
+        )
 
     _LOGGER.log(
-        logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+        verbose_info_log_level(hass),
         "Registered Ubisys services",
     )
 
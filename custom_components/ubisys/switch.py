@@ -13,12 +13,13 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 
-from .const import CONF_DEVICE_ID, CONF_DEVICE_IEEE, DOMAIN
+from .const import CONF_DEVICE_ID, CONF_DEVICE_IEEE, DOMAIN, SWITCH_MODELS
 from .ha_typing import callback as _typed_callback
-from .helpers import is_verbose_info_logging
+from .helpers import verbose_info_log_level
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,8 +36,6 @@ async def async_setup_entry(
 
     # Only create switch entities for S1/S1-R switch models
     # J1 devices are covers, D1 devices are lights
-    from .const import SWITCH_MODELS
-
     if model not in SWITCH_MODELS:
         _LOGGER.debug(
             "Skipping switch entity for non-switch device: model=%s (ieee=%s)",
@@ -56,7 +55,7 @@ async def async_setup_entry(
         return
 
     _LOGGER.log(
-        logging.INFO if is_verbose_info_logging(hass) else logging.DEBUG,
+        verbose_info_log_level(hass),
         "Creating Ubisys switch wrapper for %s (ZHA entity: %s)",
         device_ieee,
         zha_entity_id,
@@ -99,7 +98,7 @@ class UbisysSwitch(SwitchEntity):
         self._zha_entity_id = zha_entity_id
         self._device_ieee = device_ieee
         self._attr_unique_id = f"{device_ieee}_switch"
-        self._attr_device_info = {"identifiers": {(DOMAIN, device_ieee)}}
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, device_ieee)})
         self._attr_is_on: bool | None = None
 
     async def async_added_to_hass(self) -> None:
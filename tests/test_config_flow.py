@@ -318,6 +318,12 @@ async def test_options_flow_configure_j1_updates_options(
         assert result["type"] == FlowResultType.FORM
         assert result["step_id"] == "j1_advanced"
 
+    # Data and options are written together so the entry reloads only once
+    update = hass_with_config_entries.config_entries.async_update_entry
+    update.assert_called_once()
+    assert update.call_args.kwargs["data"][CONF_SHADE_TYPE] == "cellular"
+    assert update.call_args.kwargs["options"]["verbose_info_logging"] is True
+
 
 # =============================================================================
 # Test Options Flow - Configure Step (D1)
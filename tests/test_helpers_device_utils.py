@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from types import SimpleNamespace
 from typing import Any, Dict, Tuple
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -63,6 +64,13 @@ def test_extract_ieee_from_device_returns_none():
     assert helpers.extract_ieee_from_device(device) is None
 
 
+def test_extract_ieee_from_device_skips_malformed_identifiers():
+    device = SimpleNamespace(
+        identifiers={("zha",), ("other", "a", "b"), ("zha", "00:11:22:33:44:55:66:77")}
+    )
+    assert helpers.extract_ieee_from_device(device) == "00:11:22:33:44:55:66:77"
+
+
 def test_is_verbose_info_logging_prefers_runtime_flags():
     hass = DummyHass({DOMAIN: {"verbose_info_logging": True}})
     assert helpers.is_verbose_info_logging(hass) is True
@@ -73,6 +81,16 @@ def test_is_verbose_info_logging_defaults_when_missing_data():
     assert helpers.is_verbose_info_logging(hass) is helpers.VERBOSE_INFO_LOGGING
 
 
+def test_verbose_info_log_level_uses_cached_level():
+    hass = DummyHass({DOMAIN: {"info_log_level": logging.INFO}})
+    assert helpers.verbose_info_log_level(hass) == logging.INFO
+
+
+def test_verbose_info_log_level_falls_back_to_flag():
+    hass = DummyHass({DOMAIN: {"verbose_info_logging": False}})
+    assert helpers.verbose_info_log_level(hass) == logging.DEBUG
+
+
 def test_is_verbose_input_logging_prefers_runtime_flags():
     hass = DummyHass({DOMAIN: {"verbose_input_logging": False}})
     assert helpers.is_verbose_input_logging(hass) is False
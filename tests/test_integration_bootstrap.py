@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from importlib import import_module
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, Platform
+from homeassistant.core import CoreState
 
 from custom_components.ubisys.const import (
     DOMAIN,
+    EVENT_UBISYS_CALIBRATION_COMPLETE,
+    EVENT_UBISYS_INPUT,
+    MANUFACTURER,
     SERVICE_CALIBRATE_COVER,
     SERVICE_CONFIGURE_D1_BALLAST,
     SERVICE_CONFIGURE_D1_PHASE_MODE,
@@ -19,6 +26,7 @@ ubisys = import_module("custom_components.ubisys.__init__")
 discovery = import_module("custom_components.ubisys.discovery")
 entity_management = import_module("custom_components.ubisys.entity_management")
 input_monitor = import_module("custom_components.ubisys.input_monitor")
+ubisys_logbook = import_module("custom_components.ubisys.logbook")
 
 
 @pytest.mark.asyncio
@@ -37,14 +45,14 @@ async def test_async_setup_registers_services_and_handles_startup(
     # Patch at the point of use (where each function is called from)
     monkeypatch.setattr(discovery, "async_discover_devices", discover)
     monkeypatch.setattr(discovery, "async_setup_input_monitoring", monitor_setup)
+    cleanup_batch = AsyncMock(return_value=0)
+    monkeypatch.setattr(ubisys, "async_cleanup_orphaned_entities_batch", cleanup_batch)
 
-    registry_callbacks: list = []
-
-    def fake_track(hass_arg, callback):
-        registry_callbacks.append(callback)
-
+    device = MagicMock(manufacturer=MANUFACTURER)
     monkeypatch.setattr(
-        discovery, "async_track_device_registry_updated_event", fake_track
+        discovery.dr,
+        "async_get",
+        MagicMock(return_value=MagicMock(devices={"dev1": device})),
     )
 
     assert await ubisys.async_setup(hass, {})
@@ -53,19 +61,32 @@ async def test_async_setup_registers_services_and_handles_startup(
     assert hass.services.has_service(DOMAIN, SERVICE_CALIBRATE_COVER)
     assert hass.services.has_service(DOMAIN, SERVICE_CONFIGURE_D1_PHASE_MODE)
     assert hass.services.has_service(DOMAIN, SERVICE_CONFIGURE_D1_BALLAST)
+    cleanup_batch.assert_awaited_once_with(hass, {entry.data.get.return_value})
 
     hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
     await hass.async_block_till_done()
+    # Discovery and input monitoring run as background tasks, which
+    # async_block_till_done does not wait for
+    await asyncio.gather(*hass._background_tasks)
 
     assert discover.await_count == 1
     monitor_setup.assert_awaited_once_with(hass, "entry1")
-    assert registry_callbacks, "device-registry listener should be registered"
+    listeners = hass.bus.async_listeners()
+    assert listeners.get("device_registry_updated") == 1
+    assert listeners.get("entity_registry_updated") == 1
+
+    # Stopping Home Assistant detaches the discovery listeners
+    discovery.async_remove_discovery(hass)
+    listeners = hass.bus.async_listeners()
+    assert "device_registry_updated" not in listeners
+    assert "entity_registry_updated" not in listeners
 
 
 @pytest.mark.asyncio
 async def test_async_setup_entry_stores_data_and_hides_zha(hass_full, monkeypatch):
     """async_setup_entry should forward platforms and hide ZHA entity."""
     hass = hass_full
+    hass.data.setdefault(DOMAIN, {})  # async_setup always runs first
     hass.config_entries.async_forward_entry_setups = AsyncMock()
 
     hide = AsyncMock()
@@ -88,20 +109,29 @@ async def test_async_setup_entry_stores_data_and_hides_zha(hass_full, monkeypatc
     }
     entry.add_update_listener = MagicMock(return_value="listener")
     entry.async_on_unload = MagicMock()
+    entry.async_create_background_task = MagicMock(
+        side_effect=lambda hass_arg, coro, name: hass_arg.async_create_background_task(
+            coro, name
+        )
+    )
 
     await ubisys.async_setup_entry(hass, entry)
+    # ZHA entity hiding runs as an entry background task
+    await asyncio.gather(*hass._background_tasks)
 
-    # Verify new cleanup and device creation were called
-    cleanup.assert_awaited_once_with(hass, "00:11")
+    # Orphan cleanup runs once for all entries in async_setup, not per entry
+    cleanup.assert_not_awaited()
     ensure_device.assert_awaited_once_with(hass, entry)
     ensure_zha_enabled.assert_awaited_once_with(hass, entry)
 
     hass.config_entries.async_forward_entry_setups.assert_awaited_once_with(
-        entry, ubisys.PLATFORMS
+        entry, (Platform.COVER, Platform.BUTTON, Platform.SENSOR)
     )
     hide.assert_awaited_once_with(hass, entry)
     entry.async_on_unload.assert_called_once()
     assert hass.data[DOMAIN][entry.entry_id] == entry.data
+    assert hass.data[DOMAIN]["entries_by_device_id"]["device-1"] is entry
+    assert hass.data[DOMAIN]["entries_by_ieee"]["00:11"] is entry
 
 
 @pytest.mark.asyncio
@@ -110,6 +140,8 @@ async def test_async_unload_entry_unhides_and_unloads(hass_full, monkeypatch):
     hass = hass_full
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN]["entry99"] = {"device_ieee": "00:11"}
+    hass.data[DOMAIN]["entries_by_device_id"] = {"device-1": MagicMock()}
+    hass.data[DOMAIN]["entries_by_ieee"] = {"00:11": MagicMock()}
 
     entry = MagicMock()
     entry.entry_id = "entry99"
@@ -132,12 +164,577 @@ async def test_async_unload_entry_unhides_and_unloads(hass_full, monkeypatch):
     hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
 
     assert await ubisys.async_unload_entry(hass, entry)
+    # Orphan cleanup runs as a background task
+    await asyncio.gather(*hass._background_tasks)
 
     unhide.assert_awaited_once_with(hass, entry)
     untrack.assert_called_once_with(hass, entry)
     unload_monitor.assert_awaited_once_with(hass)
     cleanup.assert_awaited_once_with(hass, "00:11")  # Verify cleanup was called
     hass.config_entries.async_unload_platforms.assert_awaited_once_with(
-        entry, ubisys.PLATFORMS
+        entry, (Platform.COVER, Platform.BUTTON, Platform.SENSOR)
     )
     assert "entry99" not in hass.data[DOMAIN]
+    assert "device-1" not in hass.data[DOMAIN]["entries_by_device_id"]
+    assert "00:11" not in hass.data[DOMAIN]["entries_by_ieee"]
+
+
+def test_logbook_platform_describes_events():
+    """The logbook platform registers describers that render event data."""
+    describers = {}
+    ubisys_logbook.async_describe_events(
+        MagicMock(),
+        lambda domain, event_type, describe: describers.setdefault(
+            event_type, describe
+        ),
+    )
+
+    calibration = MagicMock(data={"shade_type": "venetian", "duration_s": 42.0})
+    assert describers[EVENT_UBISYS_CALIBRATION_COMPLETE](calibration) == {
+        "name": "Ubisys",
+        "message": "calibration completed (venetian) in 42.0s",
+    }
+
+    press = MagicMock(data={"press_type": "short_press"})
+    assert describers[EVENT_UBISYS_INPUT](press) == {
+        "name": "Ubisys",
+        "message": "input short_press on input ?",
+    }
+
+
+@pytest.mark.asyncio
+async def test_options_update_listener_reloads_on_shade_type_change(hass_full):
+    """Changing the shade type should reload the entry via the entry manager."""
+    hass = hass_full
+    hass.config_entries.async_reload = AsyncMock()
+    hass.data.setdefault(DOMAIN, {})["entry7"] = {"shade_type": "roller"}
+
+    entry = MagicMock()
+    entry.entry_id = "entry7"
+    entry.data = {"shade_type": "roller"}
+
+    await entity_management.options_update_listener(hass, entry)
+    hass.config_entries.async_reload.assert_not_awaited()
+
+    entry.data = {"shade_type": "venetian"}
+    await entity_management.options_update_listener(hass, entry)
+    hass.config_entries.async_reload.assert_awaited_once_with("entry7")
+
+
+@pytest.mark.asyncio
+async def test_device_create_burst_triggers_single_discovery(hass_full, monkeypatch):
+    """A burst of device-create events should coalesce into one discovery."""
+    hass = hass_full
+    hass.data.setdefault(DOMAIN, {})
+
+    device = MagicMock()
+    device.manufacturer = "ubisys"
+    device.model = "J1 (5502)"
+    device.identifiers = {("zha", "00:11")}
+    registry = MagicMock()
+    registry.async_get.return_value = device
+    monkeypatch.setattr(discovery.dr, "async_get", lambda hass_arg: registry)
+
+    discover = AsyncMock()
+    monkeypatch.setattr(discovery, "async_discover_devices", discover)
+    monkeypatch.setattr(discovery, "DISCOVERY_DEBOUNCE_DELAY", 0)
+
+    discovery._async_setup_discovery_listeners(hass)
+
+    for device_id in ("dev-1", "dev-2", "dev-3"):
+        hass.bus.async_fire(
+            discovery.dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            {"action": "create", "device_id": device_id},
+        )
+
+    await asyncio.sleep(0.01)
+    await asyncio.gather(*hass._background_tasks)
+
+    await asyncio.sleep(0.01)
+
+    assert discover.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_device_created_during_scan_triggers_rescan(hass_full, monkeypatch):
+    """A device created while a debounced scan runs is picked up afterwards."""
+    hass = hass_full
+    hass.data.setdefault(DOMAIN, {})
+
+    device = MagicMock()
+    device.manufacturer = "ubisys"
+    device.model = "J1"
+    device.identifiers = {("zha", "00:11")}
+    registry = MagicMock()
+    registry.async_get.return_value = device
+    monkeypatch.setattr(discovery.dr, "async_get", lambda hass_arg: registry)
+
+    async def _scan(hass_arg):
+        if discover.await_count == 1:
+            hass.bus.async_fire(
+                discovery.dr.EVENT_DEVICE_REGISTRY_UPDATED,
+                {"action": "create", "device_id": "dev-2"},
+            )
+            await asyncio.sleep(0.01)
+
+    discover = AsyncMock(side_effect=_scan)
+    monkeypatch.setattr(discovery, "async_discover_devices", discover)
+    monkeypatch.setattr(discovery, "DISCOVERY_DEBOUNCE_DELAY", 0)
+
+    discovery._async_setup_discovery_listeners(hass)
+    hass.bus.async_fire(
+        discovery.dr.EVENT_DEVICE_REGISTRY_UPDATED,
+        {"action": "create", "device_id": "dev-1"},
+    )
+
+    for _ in range(10):
+        await asyncio.sleep(0.01)
+        await asyncio.gather(*hass._background_tasks)
+
+    assert discover.await_count == 2
+
+
+def test_update_verbose_flags_tracks_entry_contributions(hass_full):
+    """Verbose flags should follow per-entry option changes and unloads."""
+    hass = hass_full
+    quiet = MagicMock(entry_id="quiet", options={})
+    loud = MagicMock(entry_id="loud", options={"verbose_info_logging": True})
+    hass.config_entries.async_entries = MagicMock(return_value=[quiet, loud])
+
+    entity_management.update_verbose_flags(hass, quiet)
+    assert hass.data[DOMAIN]["verbose_info_logging"] is True
+    assert hass.data[DOMAIN]["verbose_input_logging"] is False
+
+    quiet.options = {"verbose_input_logging": True}
+    entity_management.update_verbose_flags(hass, quiet)
+    assert hass.data[DOMAIN]["verbose_input_logging"] is True
+
+    assert hass.data[DOMAIN]["info_log_level"] == logging.INFO
+
+    entity_management.update_verbose_flags(hass, loud, unloading=True)
+    assert hass.data[DOMAIN]["verbose_info_logging"] is False
+    assert hass.data[DOMAIN]["info_log_level"] == logging.DEBUG
+    assert hass.data[DOMAIN]["verbose_input_logging"] is True
+
+
+@pytest.mark.asyncio
+async def test_async_discover_devices_remembers_only_unsupported_models(
+    hass_full, monkeypatch
+):
+    """Unsupported models are skipped on rescans; supported devices are not."""
+    hass = hass_full
+
+    device = MagicMock()
+    device.id = "dev-1"
+    device.manufacturer = "ubisys"
+    device.model = "J1 (5502)"
+    device.name = "Shade"
+    device.identifiers = {("zha", "00:11")}
+    device.config_entries = {"zha-entry"}
+    other = MagicMock()
+    other.id = "dev-2"
+    other.manufacturer = "acme"
+    other.config_entries = {"zha-entry"}
+    unsupported = MagicMock()
+    unsupported.id = "dev-3"
+    unsupported.manufacturer = "ubisys"
+    unsupported.model = "X9"
+    unsupported.identifiers = {("zha", "00:33")}
+    unsupported.config_entries = {"zha-entry"}
+    # Not linked to a ZHA config entry: never a candidate
+    non_zha = MagicMock()
+    non_zha.id = "dev-4"
+    non_zha.manufacturer = "ubisys"
+    non_zha.model = "J1"
+    non_zha.identifiers = {("zha", "00:44")}
+    non_zha.config_entries = {"other-entry"}
+
+    zha_entry = MagicMock(entry_id="zha-entry")
+    hass.config_entries.async_entries = MagicMock(
+        side_effect=lambda domain=None: [zha_entry] if domain == "zha" else []
+    )
+    hass.config_entries.flow = MagicMock()
+    hass.config_entries.flow.async_init = AsyncMock()
+    monkeypatch.setattr(
+        discovery.dr,
+        "async_get",
+        lambda hass_arg: MagicMock(
+            devices={d.id: d for d in [device, other, unsupported, non_zha]}
+        ),
+    )
+
+    await discovery.async_discover_devices(hass)
+    await discovery.async_discover_devices(hass)
+
+    # The flow's unique_id handling dedupes repeated offers, so a dismissed
+    # flow can be offered again by a later scan
+    assert hass.config_entries.flow.async_init.await_count == 2
+    assert hass.data[DOMAIN]["discovery_seen_devices"] == {"dev-3"}
+    data = hass.config_entries.flow.async_init.await_args.kwargs["data"]
+    assert data["device_ieee"] == "00:11"
+    assert data["model"] == "J1"
+
+
+@pytest.mark.asyncio
+async def test_async_discover_devices_reads_configured_entries_once(
+    hass_full, monkeypatch
+):
+    """Configured devices are matched against one snapshot of the entries."""
+    hass = hass_full
+
+    devices = []
+    for index in range(3):
+        device = MagicMock()
+        device.id = f"dev-{index}"
+        device.manufacturer = "ubisys"
+        device.model = "J1"
+        device.identifiers = {("zha", f"00:0{index}")}
+        device.config_entries = {"zha-entry"}
+        devices.append(device)
+
+    zha_entry = MagicMock(entry_id="zha-entry")
+    ubisys_entries = [
+        MagicMock(data={"device_ieee": "00:00"}),
+        MagicMock(data={"device_ieee": "00:02"}),
+    ]
+    hass.config_entries.async_entries = MagicMock(
+        side_effect=lambda domain=None: (
+            [zha_entry] if domain == "zha" else ubisys_entries
+        )
+    )
+    hass.config_entries.flow = MagicMock()
+    hass.config_entries.flow.async_init = AsyncMock()
+    monkeypatch.setattr(
+        discovery.dr,
+        "async_get",
+        lambda hass_arg: MagicMock(devices={d.id: d for d in devices}),
+    )
+
+    await discovery.async_discover_devices(hass)
+    await hass.async_block_till_done()
+
+    domain_calls = [
+        call
+        for call in hass.config_entries.async_entries.call_args_list
+        if call.args == (DOMAIN,)
+    ]
+    assert len(domain_calls) == 1
+    hass.config_entries.flow.async_init.assert_awaited_once()
+    data = hass.config_entries.flow.async_init.await_args.kwargs["data"]
+    assert data["device_ieee"] == "00:01"
+
+
+@pytest.mark.asyncio
+async def test_async_discover_devices_rejects_foreign_devices_by_manufacturer(
+    hass_full, monkeypatch
+):
+    """Non-Ubisys devices are dropped before identifiers or model are read."""
+    hass = hass_full
+    # No identifiers/model attributes: touching them would raise
+    foreign = [
+        SimpleNamespace(
+            id=f"dev-{i}", manufacturer="acme", config_entries={"zha-entry"}
+        )
+        for i in range(5)
+    ]
+
+    zha_entry = MagicMock(entry_id="zha-entry")
+    hass.config_entries.async_entries = MagicMock(
+        side_effect=lambda domain=None: [zha_entry] if domain == "zha" else []
+    )
+    hass.config_entries.flow = MagicMock()
+    hass.config_entries.flow.async_init = AsyncMock()
+    monkeypatch.setattr(
+        discovery.dr,
+        "async_get",
+        lambda hass_arg: MagicMock(devices={d.id: d for d in foreign}),
+    )
+
+    await discovery.async_discover_devices(hass)
+
+    hass.config_entries.flow.async_init.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_discover_devices_retries_failed_flow(hass_full, monkeypatch):
+    """A flow that fails to start is retried on the next scan."""
+    hass = hass_full
+    devices = []
+    for index in range(2):
+        device = MagicMock()
+        device.id = f"dev-{index}"
+        device.manufacturer = "ubisys"
+        device.model = "D1"
+        device.name = None
+        device.identifiers = {("zha", f"00:0{index}")}
+        device.config_entries = {"zha-entry"}
+        devices.append(device)
+
+    zha_entry = MagicMock(entry_id="zha-entry")
+    hass.config_entries.async_entries = MagicMock(
+        side_effect=lambda domain=None: [zha_entry] if domain == "zha" else []
+    )
+
+    async def _async_init(domain, *, context, data):
+        if data["device_ieee"] == "00:00":
+            raise RuntimeError("boom")
+
+    hass.config_entries.flow = MagicMock()
+    hass.config_entries.flow.async_init = AsyncMock(side_effect=_async_init)
+    monkeypatch.setattr(
+        discovery.dr,
+        "async_get",
+        lambda hass_arg: MagicMock(devices={d.id: d for d in devices}),
+    )
+
+    await discovery.async_discover_devices(hass)
+    assert hass.config_entries.flow.async_init.await_count == 2
+
+    await discovery.async_discover_devices(hass)
+    assert hass.config_entries.flow.async_init.await_count == 4
+    retried = [
+        call.kwargs["data"]["device_ieee"]
+        for call in hass.config_entries.flow.async_init.await_args_list[2:]
+    ]
+    assert "00:00" in retried
+
+
+def test_async_setup_discovery_registers_listeners_once(hass_full, monkeypatch):
+    """Repeated discovery setup does not stack registry listeners."""
+    hass = hass_full
+    monkeypatch.setattr(discovery, "async_at_started", MagicMock())
+
+    discovery.async_setup_discovery(hass)
+    listeners = hass.bus.async_listeners().get("entity_registry_updated", 0)
+    discovery.async_setup_discovery(hass)
+
+    assert listeners == 1
+    assert hass.bus.async_listeners().get("entity_registry_updated", 0) == 1
+    discovery.async_at_started.assert_called_once()
+
+
+def test_zha_entity_index_built_once_and_invalidated(hass_full):
+    """Device-scoped ZHA lookups reuse the cached index until invalidated."""
+    hass = hass_full
+    cover = MagicMock(entity_id="cover.zha", platform="zha", device_id="dev1")
+    other = MagicMock(entity_id="light.other", platform="hue", device_id="dev1")
+    entities = MagicMock()
+    entities.values = MagicMock(return_value=[cover, other])
+    registry = MagicMock(entities=entities)
+    registry.async_get = MagicMock(side_effect={"cover.zha": cover}.get)
+
+    lookup = entity_management.async_zha_entities_for_device
+    assert lookup(hass, registry, "dev1") == [cover]
+    assert lookup(hass, registry, "dev2") == []
+    assert entities.values.call_count == 1
+
+    entity_management.invalidate_zha_entity_cache(hass)
+    assert lookup(hass, registry, "dev1") == [cover]
+    assert entities.values.call_count == 2
+
+    entity_management.invalidate_zha_entity_cache(hass)
+    assert lookup(hass, registry, "") == []
+    assert entities.values.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_entity_rename_invalidates_zha_entity_index(hass_full, monkeypatch):
+    """Renaming an entity drops the cached index that holds its old entity_id."""
+    hass = hass_full
+    monkeypatch.setattr(discovery, "async_at_started", MagicMock())
+    discovery.async_setup_discovery(hass)
+    domain_data = hass.data[DOMAIN]
+
+    domain_data["zha_entities_by_device"] = {"dev1": ["cover.old"]}
+    hass.bus.async_fire(
+        "entity_registry_updated",
+        {"action": "update", "entity_id": "cover.new", "changes": {"name": None}},
+    )
+    await hass.async_block_till_done()
+    assert "zha_entities_by_device" in domain_data
+
+    hass.bus.async_fire(
+        "entity_registry_updated",
+        {
+            "action": "update",
+            "entity_id": "cover.new",
+            "old_entity_id": "cover.old",
+            "changes": {"entity_id": "cover.old"},
+        },
+    )
+    await hass.async_block_till_done()
+    assert "zha_entities_by_device" not in domain_data
+
+
+@pytest.mark.asyncio
+async def test_startup_skips_work_without_ubisys_devices(hass_full, monkeypatch):
+    """Nothing is scheduled at startup when no Ubisys devices or entries exist."""
+    hass = hass_full
+    hass.config_entries.async_entries = MagicMock(return_value=[])
+
+    discover = AsyncMock()
+    monitor_setup = AsyncMock()
+    monkeypatch.setattr(discovery, "async_discover_devices", discover)
+    monkeypatch.setattr(discovery, "async_setup_input_monitoring", monitor_setup)
+    other = MagicMock(manufacturer="IKEA of Sweden")
+    monkeypatch.setattr(
+        discovery.dr,
+        "async_get",
+        MagicMock(return_value=MagicMock(devices={"dev1": other})),
+    )
+
+    discovery.async_setup_discovery(hass)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    await asyncio.gather(*hass._background_tasks)
+
+    discover.assert_not_awaited()
+    monitor_setup.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_zha_entity_visibility_skips_noop_writes(hass_full, monkeypatch):
+    """Hide/unhide only write to the registry when the state changes."""
+    hass = hass_full
+    er = entity_management.er
+    entry = MagicMock(data={"device_ieee": "00:11", "model": "J1", "device_id": "dev1"})
+    zha_cover = MagicMock(
+        entity_id="cover.zha", domain="cover", disabled_by=None, hidden_by=None
+    )
+    registry = MagicMock()
+    monkeypatch.setattr(er, "async_get", MagicMock(return_value=registry))
+    monkeypatch.setattr(
+        entity_management,
+        "async_zha_entities_for_device",
+        MagicMock(return_value=[zha_cover]),
+    )
+
+    await entity_management.async_unhide_zha_entity(hass, entry)
+    registry.async_update_entity.assert_not_called()
+
+    await entity_management.async_hide_zha_entity(hass, entry)
+    registry.async_update_entity.assert_called_once_with(
+        "cover.zha",
+        disabled_by=er.RegistryEntryDisabler.INTEGRATION,
+        hidden_by=er.RegistryEntryHider.INTEGRATION,
+    )
+
+    # Steady state after setup: hidden, and re-enabled by
+    # async_ensure_zha_entity_enabled so the wrapper can delegate to it
+    zha_cover.disabled_by = None
+    zha_cover.hidden_by = er.RegistryEntryHider.INTEGRATION
+    registry.async_update_entity.reset_mock()
+    await entity_management.async_hide_zha_entity(hass, entry)
+    registry.async_update_entity.assert_not_called()
+
+    await entity_management.async_unhide_zha_entity(hass, entry)
+    registry.async_update_entity.assert_called_once_with("cover.zha", hidden_by=None)
+
+
+@pytest.mark.asyncio
+async def test_ensure_device_entry_links_zha_device_and_drops_orphan(
+    hass_full, monkeypatch
+):
+    """The ZHA device is found by identifier and stale Ubisys devices unlinked."""
+    hass = hass_full
+    dr = entity_management.dr
+    entry = MagicMock(
+        entry_id="entry1",
+        data={"device_ieee": "00:11", "model": "J1", "name": "Blind"},
+    )
+    zha_device = MagicMock(id="zha_dev", identifiers={("zha", "00:11")})
+    orphan = MagicMock(id="orphan_dev", identifiers={(DOMAIN, "00:11")})
+    registry = MagicMock()
+    registry.async_get_device = MagicMock(return_value=zha_device)
+    registry.async_update_device = MagicMock(return_value=zha_device)
+    monkeypatch.setattr(dr, "async_get", MagicMock(return_value=registry))
+    monkeypatch.setattr(
+        dr,
+        "async_entries_for_config_entry",
+        MagicMock(return_value=[zha_device, orphan]),
+    )
+    hass.config_entries.async_update_entry = MagicMock()
+
+    await entity_management.async_ensure_device_entry(hass, entry)
+
+    registry.async_get_device.assert_called_once_with(identifiers={("zha", "00:11")})
+    registry.async_update_device.assert_any_call(
+        "orphan_dev", remove_config_entry_id="entry1"
+    )
+
+
+@pytest.mark.asyncio
+async def test_discovery_runs_immediately_when_already_started(hass_full, monkeypatch):
+    """Adding the integration after startup must still run discovery."""
+    hass = hass_full
+    hass.state = CoreState.running
+
+    discover = AsyncMock()
+    monkeypatch.setattr(discovery, "async_discover_devices", discover)
+    device = MagicMock(manufacturer=MANUFACTURER)
+    monkeypatch.setattr(
+        discovery.dr,
+        "async_get",
+        MagicMock(return_value=MagicMock(devices={"dev1": device})),
+    )
+
+    discovery.async_setup_discovery(hass)
+    await hass.async_block_till_done()
+    await asyncio.gather(*hass._background_tasks)
+
+    discover.assert_awaited_once_with(hass)
+
+
+@pytest.mark.asyncio
+async def test_registered_service_handler_receives_hass(hass_full, monkeypatch):
+    """Table-registered services run with hass bound to the handler."""
+    hass = hass_full
+    services = import_module("custom_components.ubisys.services")
+    d1_config = import_module("custom_components.ubisys.d1_config")
+    configure = AsyncMock()
+    monkeypatch.setattr(d1_config, "async_configure_phase_mode", configure)
+
+    services.async_setup_services(hass)
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_CONFIGURE_D1_PHASE_MODE,
+        {"entity_id": "light.d1", "phase_mode": "reverse"},
+        blocking=True,
+    )
+
+    configure.assert_awaited_once_with(hass, "light.d1", "reverse")
+
+
+@pytest.mark.asyncio
+async def test_ensure_device_entry_skips_update_when_already_linked(
+    hass_full, monkeypatch
+):
+    """A device already carrying our entry and identifier is not rewritten."""
+    hass = hass_full
+    dr = entity_management.dr
+    entry = MagicMock(
+        entry_id="entry1",
+        data={
+            "device_ieee": "00:11",
+            "device_id": "zha_dev",
+            "model": "J1",
+            "name": "Blind",
+        },
+    )
+    zha_device = MagicMock(
+        id="zha_dev",
+        config_entries={"zha_entry", "entry1"},
+        identifiers={("zha", "00:11"), (DOMAIN, "00:11")},
+    )
+    registry = MagicMock()
+    registry.async_get_device = MagicMock(return_value=zha_device)
+    monkeypatch.setattr(dr, "async_get", MagicMock(return_value=registry))
+    monkeypatch.setattr(
+        dr, "async_entries_for_config_entry", MagicMock(return_value=[zha_device])
+    )
+    hass.config_entries.async_update_entry = MagicMock()
+
+    await entity_management.async_ensure_device_entry(hass, entry)
+
+    registry.async_update_device.assert_not_called()
+    hass.config_entries.async_update_entry.assert_not_called()
@@ -4,7 +4,8 @@ Tests cover the 5-phase automated calibration process with motor stall detection
 """
 
 import asyncio
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.core import ServiceCall
@@ -19,6 +20,8 @@ from custom_components.ubisys.const import (
 from custom_components.ubisys.j1_calibration import (
     _enter_calibration_mode,
     _exit_calibration_mode,
+    _find_zha_cover_entity,
+    _read_total_steps,
     _wait_for_stall,
     async_calibrate_j1,
 )
@@ -103,56 +106,99 @@ async def test_exit_calibration_mode(mock_window_covering_cluster):
 # =============================================================================
 
 
+@pytest.fixture
+def fast_stall(monkeypatch):
+    """Shorten the stall window so stall tests run quickly."""
+    monkeypatch.setattr(
+        "custom_components.ubisys.j1_calibration.STALL_DETECTION_TIME", 0.2
+    )
+
+
 @pytest.mark.asyncio
-async def test_wait_for_stall_detects_stall():
+async def test_wait_for_stall_detects_stall(hass_full, fast_stall):
     """Test that stall detection works when position stops changing."""
-    mock_hass = MagicMock()
+    hass = hass_full
     entity_id = "cover.test_j1"
+    hass.states.async_set(entity_id, "opening", {"current_position": 80})
+
+    async def _move() -> None:
+        for pos in (90, 100):
+            await asyncio.sleep(0.05)
+            hass.states.async_set(entity_id, "opening", {"current_position": pos})
 
-    # Mock state that shows position unchanging
-    mock_state = MagicMock()
-    mock_state.attributes = {"current_position": 100}
-    mock_hass.states.get.return_value = mock_state
+    mover = hass.async_create_task(_move())
 
-    # Should detect stall at position 100
-    position = await _wait_for_stall(mock_hass, entity_id, "test phase", timeout=10)
+    # Should detect stall at the last reported position
+    position = await _wait_for_stall(hass, entity_id, "test phase", timeout=10)
+    await mover
 
     assert position == 100
-    # Verify we checked the state multiple times
-    assert mock_hass.states.get.call_count >= 2
+    # The state listener is released once the wait finishes
+    assert not hass.bus.async_listeners().get("state_changed")
 
 
 @pytest.mark.asyncio
-async def test_wait_for_stall_timeout():
-    """Test that stall detection times out if position keeps changing."""
-    mock_hass = MagicMock()
+async def test_wait_for_stall_ignores_updates_without_movement(hass_full, fast_stall):
+    """State writes that keep the same position do not restart the stall window."""
+    hass = hass_full
     entity_id = "cover.test_j1"
+    hass.states.async_set(entity_id, "opening", {"current_position": 50})
 
-    # Mock state that keeps changing position
-    position_values = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
-    mock_states_list = []
-    for pos in position_values:
-        mock_state = MagicMock()
-        mock_state.attributes = {"current_position": pos}
-        mock_states_list.append(mock_state)
+    async def _chatter() -> None:
+        rssi = 0
+        while True:
+            await asyncio.sleep(0.05)
+            rssi += 1
+            hass.states.async_set(
+                entity_id, "opening", {"current_position": 50, "rssi": rssi}
+            )
 
-    # Return different positions each time
-    mock_hass.states.get.side_effect = mock_states_list * 100  # Repeat many times
+    chatter = hass.async_create_task(_chatter())
+    try:
+        assert await _wait_for_stall(hass, entity_id, "test phase", timeout=2) == 50
+    finally:
+        chatter.cancel()
 
-    # Should timeout after 5 seconds
-    with pytest.raises(HomeAssistantError, match="Timeout"):
-        await _wait_for_stall(mock_hass, entity_id, "test phase", timeout=5)
+
+@pytest.mark.asyncio
+async def test_wait_for_stall_timeout(hass_full, fast_stall):
+    """Test that stall detection times out if position keeps changing."""
+    hass = hass_full
+    entity_id = "cover.test_j1"
+    hass.states.async_set(entity_id, "opening", {"current_position": 0})
+
+    async def _move() -> None:
+        pos = 0
+        while True:
+            await asyncio.sleep(0.05)
+            pos = (pos + 1) % 100
+            hass.states.async_set(entity_id, "opening", {"current_position": pos})
+
+    mover = hass.async_create_task(_move())
+    try:
+        with pytest.raises(HomeAssistantError, match="Timeout"):
+            await _wait_for_stall(hass, entity_id, "test phase", timeout=1)
+    finally:
+        mover.cancel()
 
 
 @pytest.mark.asyncio
-async def test_wait_for_stall_entity_unavailable():
+async def test_wait_for_stall_entity_unavailable(hass_full):
     """Test stall detection fails gracefully when entity unavailable."""
-    mock_hass = MagicMock()
+    with pytest.raises(HomeAssistantError, match="not found"):
+        await _wait_for_stall(hass_full, "cover.test_j1", "test phase", timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_stall_entity_removed(hass_full, fast_stall):
+    """Removing the entity mid-move aborts the wait."""
+    hass = hass_full
     entity_id = "cover.test_j1"
-    mock_hass.states.get.return_value = None
+    hass.states.async_set(entity_id, "opening", {"current_position": 10})
+    hass.loop.call_later(0.05, hass.states.async_remove, entity_id)
 
     with pytest.raises(HomeAssistantError, match="not found"):
-        await _wait_for_stall(mock_hass, entity_id, "test phase", timeout=5)
+        await _wait_for_stall(hass, entity_id, "test phase", timeout=5)
 
 
 # =============================================================================
@@ -210,6 +256,9 @@ async def test_calibrate_prevents_concurrent_calibration(
     # Setup mock hass
     mock_hass = MagicMock()
     mock_hass.data = {DOMAIN: {}}
+    mock_hass.async_create_task.side_effect = lambda coro, name=None: (
+        asyncio.ensure_future(coro)
+    )
 
     # Mock config_entries properly
     mock_hass.config_entries = MagicMock()
@@ -248,9 +297,12 @@ async def test_calibrate_prevents_concurrent_calibration(
                     # Wait a bit to ensure first calibration acquires lock
                     await asyncio.sleep(0.1)
 
-                    # Try to start second calibration (should fail immediately)
+                    # A different entity on the same device must not start a
+                    # second calibration (should fail immediately)
+                    other_call = MagicMock(spec=ServiceCall)
+                    other_call.data = {"entity_id": "cover.test_j1_alias"}
                     with pytest.raises(HomeAssistantError, match="already in progress"):
-                        await async_calibrate_j1(mock_hass, mock_service_call)
+                        await async_calibrate_j1(mock_hass, other_call)
 
                     # Cancel first task to clean up
                     task1.cancel()
@@ -260,6 +312,46 @@ async def test_calibrate_prevents_concurrent_calibration(
                         pass
 
 
+@pytest.mark.asyncio
+async def test_calibrate_shares_in_flight_request(
+    mock_service_call, mock_entity_registry, mock_config_entry
+):
+    """Test that a repeated request for the same entity joins the running one."""
+    mock_hass = MagicMock()
+    mock_hass.data = {DOMAIN: {}}
+    mock_hass.config_entries.async_get_entry.return_value = mock_config_entry
+    mock_hass.async_create_task.side_effect = lambda coro, name=None: (
+        asyncio.ensure_future(coro)
+    )
+
+    release = asyncio.Event()
+
+    async def slow_calibration(*args):
+        await release.wait()
+        return 1000, 1000
+
+    with (
+        patch(
+            "custom_components.ubisys.j1_calibration._find_zha_cover_entity",
+            return_value="cover.zha_test_j1",
+        ),
+        patch(
+            "custom_components.ubisys.j1_calibration._perform_calibration",
+            side_effect=slow_calibration,
+        ) as mock_perform,
+    ):
+        first = asyncio.create_task(async_calibrate_j1(mock_hass, mock_service_call))
+        await asyncio.sleep(0.05)
+        second = asyncio.create_task(async_calibrate_j1(mock_hass, mock_service_call))
+        await asyncio.sleep(0.05)
+
+        release.set()
+        await asyncio.gather(first, second)
+
+    assert mock_perform.call_count == 1
+    assert mock_hass.data[DOMAIN]["calibrations_in_flight"] == {}
+
+
 # =============================================================================
 # Test Error Handling
 # =============================================================================
@@ -276,15 +368,77 @@ async def test_calibration_handles_cluster_errors(mock_window_covering_cluster):
 
 
 @pytest.mark.asyncio
-async def test_wait_for_stall_handles_missing_position():
+async def test_wait_for_stall_handles_missing_position(hass_full, fast_stall):
     """Test stall detection handles missing current_position attribute."""
-    mock_hass = MagicMock()
+    hass = hass_full
     entity_id = "cover.test_j1"
-
-    mock_state = MagicMock()
-    mock_state.attributes = {}  # No current_position
-    mock_hass.states.get.return_value = mock_state
+    hass.states.async_set(entity_id, "opening", {})  # No current_position
 
     # Should timeout after warning about missing position
     with pytest.raises(HomeAssistantError, match="Timeout"):
-        await _wait_for_stall(mock_hass, entity_id, "test phase", timeout=5)
+        await _wait_for_stall(hass, entity_id, "test phase", timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_find_zha_cover_entity_uses_device_index():
+    """The ZHA cover is resolved from the device index, skipping disabled ones."""
+    disabled = SimpleNamespace(
+        entity_id="cover.old", platform="zha", device_id="dev1", disabled_by="user"
+    )
+    light = SimpleNamespace(
+        entity_id="light.zha", platform="zha", device_id="dev1", disabled_by=None
+    )
+    cover = SimpleNamespace(
+        entity_id="cover.zha", platform="zha", device_id="dev1", disabled_by=None
+    )
+    for entry in (disabled, light, cover):
+        entry.domain = entry.entity_id.split(".")[0]
+    entities = {entry.entity_id: entry for entry in (disabled, light, cover)}
+    registry = MagicMock()
+    registry.entities.values.return_value = list(entities.values())
+    registry.async_get.side_effect = entities.get
+    hass = MagicMock()
+    hass.data = {}
+
+    assert await _find_zha_cover_entity(hass, "dev1", registry) == "cover.zha"
+    assert await _find_zha_cover_entity(hass, "dev2", registry) is None
+    registry.entities.values.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_find_zha_cover_entity_ignores_disabled_cover():
+    """A device whose only ZHA cover is disabled has no cover to monitor."""
+    disabled = SimpleNamespace(
+        entity_id="cover.zha",
+        domain="cover",
+        platform="zha",
+        device_id="dev1",
+        disabled_by="user",
+    )
+    registry = MagicMock()
+    registry.entities.values.return_value = [disabled]
+    registry.async_get.side_effect = {disabled.entity_id: disabled}.get
+    hass = MagicMock()
+    hass.data = {}
+
+    assert await _find_zha_cover_entity(hass, "dev1", registry) is None
+
+    disabled.disabled_by = None
+    assert await _find_zha_cover_entity(hass, "dev1", registry) == "cover.zha"
+
+
+@pytest.mark.asyncio
+async def test_read_total_steps_retries_until_valid():
+    """An invalid total_steps read is retried with backoff until a valid value arrives."""
+    cluster = MagicMock()
+    cluster.read_attributes = AsyncMock(
+        side_effect=[({0x1002: 0xFFFF}, {}), ({0x1002: 4200}, {})]
+    )
+
+    with patch(
+        "custom_components.ubisys.j1_calibration.asyncio.sleep", new=AsyncMock()
+    ) as sleep:
+        assert await _read_total_steps(cluster, 0x1002) == 4200
+
+    assert cluster.read_attributes.await_count == 2
+    sleep.assert_awaited_once_with(0.25)